@@ -14,7 +14,7 @@ from pinpoint_eda.aws_session import AWSSessionManager
 from pinpoint_eda.checkpoint import CheckpointManager
 from pinpoint_eda.config import AccountConfig, ScanConfig
 from pinpoint_eda.exceptions import PinpointEDAError
-from pinpoint_eda.executor import ScanExecutor
+from pinpoint_eda.executor import InstrumentedThreadPoolExecutor, ScanExecutor
 from pinpoint_eda.progress import ProgressDisplay
 from pinpoint_eda.rate_limiter import RateLimiter
 from pinpoint_eda.region_discovery import discover_regions
@@ -34,6 +34,11 @@ class Orchestrator:
         self.rate_limiter = RateLimiter(requests_per_second=50.0)
         self.checkpoint = CheckpointManager(config.output_dir, config.config_hash())
         self.executor = ScanExecutor(max_workers=config.max_workers)
+        # One shared I/O pool for all scanners -- avoids per-scanner thread startup
+        self.io_pool = InstrumentedThreadPoolExecutor(
+            max_workers=config.max_workers * 2,
+            thread_name_prefix="scanner-io",
+        )
         self.progress = ProgressDisplay(console) if not config.json_only else None
         self._results: dict[str, list[ScanResult]] = {}
         self._account_ids: dict[str, str] = {}
@@ -83,6 +88,10 @@ class Orchestrator:
         except KeyboardInterrupt:
             self.console.print("\n[yellow]Scan interrupted. Use --resume to continue.[/]")
         finally:
+            # Persist any batched checkpoint marks so --resume sees them
+            self.checkpoint.flush()
+            self.executor.close()
+            self.io_pool.shutdown(wait=False, cancel_futures=True)
             if self.progress:
                 self.progress.stop()
 
@@ -299,8 +308,15 @@ class Orchestrator:
                     region=region,
                     progress=self.progress,
                     kpi_days=self.config.kpi_days,
+                    io_pool=self.io_pool,
                 )
+                scan_started = time.monotonic()
                 scan_result = scanner.scan()
+                scan_result.metadata["_duration_ms"] = round(
+                    (time.monotonic() - scan_started) * 1000
+                )
+                if (pool_stats := scanner.pool_stats()) is not None:
+                    scan_result.metadata["_pool"] = pool_stats
                 self.checkpoint.mark_completed(
                     ck_key, scan_result.resource_count, scan_result.to_dict()
                 )
@@ -356,8 +372,15 @@ class Orchestrator:
                     app_id=app_id,
                     progress=self.progress,
                     kpi_days=self.config.kpi_days,
+                    io_pool=self.io_pool,
                 )
+                scan_started = time.monotonic()
                 scan_result = scanner.scan()
+                scan_result.metadata["_duration_ms"] = round(
+                    (time.monotonic() - scan_started) * 1000
+                )
+                if (pool_stats := scanner.pool_stats()) is not None:
+                    scan_result.metadata["_pool"] = pool_stats
                 self.checkpoint.mark_completed(
                     ck_key, scan_result.resource_count, scan_result.to_dict()
                 )
@@ -13,9 +13,15 @@ from pinpoint_eda.exceptions import AWSSessionError, RoleAssumptionError
 
 logger = logging.getLogger(__name__)
 
+# Pool must accommodate the full thread fan-out through one shared client:
+# up to 50 executor threads (the --max-workers cap) plus the io_pool at
+# 2x max_workers, i.e. 150 concurrent callers at the cap. Anything smaller
+# makes urllib3 silently discard connections and serialize the overflow;
+# keepalive avoids re-handshaking TLS per burst.
 BOTO_CONFIG = Config(
     retries={"max_attempts": 3, "mode": "adaptive"},
-    max_pool_connections=25,
+    max_pool_connections=160,
+    tcp_keepalive=True,
 )
 
 
@@ -25,6 +31,9 @@ class AWSSessionManager:
     def __init__(self, accounts: list[AccountConfig]) -> None:
         self._accounts = accounts
         self._sessions: dict[str, boto3.Session] = {}
+        # boto3 clients are thread-safe; share one per (account, service,
+        # region) so concurrent scanners reuse the same connection pool.
+        self._clients: dict[tuple[str, str, str], Any] = {}
 
     def get_session(self, account: AccountConfig) -> boto3.Session:
         """Get or create a boto3 session for the given account config."""
@@ -48,16 +57,24 @@ class AWSSessionManager:
     def get_pinpoint_client(
         self, account: AccountConfig, region: str
     ) -> Any:
-        """Create a Pinpoint client for a specific account and region."""
-        session = self.get_session(account)
-        return session.client("pinpoint", region_name=region, config=BOTO_CONFIG)
+        """Get or create a shared Pinpoint client for an account and region."""
+        return self._get_client(account, "pinpoint", region)
 
     def get_sms_voice_v2_client(
         self, account: AccountConfig, region: str
     ) -> Any:
-        """Create a PinpointSMSVoiceV2 client for a specific account and region."""
-        session = self.get_session(account)
-        return session.client("pinpoint-sms-voice-v2", region_name=region, config=BOTO_CONFIG)
+        """Get or create a shared PinpointSMSVoiceV2 client for an account and region."""
+        return self._get_client(account, "pinpoint-sms-voice-v2", region)
+
+    def _get_client(self, account: AccountConfig, service: str, region: str) -> Any:
+        """Return a cached client, creating it on first use."""
+        cache_key = (account.label, service, region)
+        client = self._clients.get(cache_key)
+        if client is None:
+            session = self.get_session(account)
+            client = session.client(service, region_name=region, config=BOTO_CONFIG)
+            self._clients[cache_key] = client
+        return client
 
     def _assume_role(self, account: AccountConfig) -> boto3.Session:
         """Assume an IAM role and return a session with temporary credentials."""
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import json
 import logging
 import os
@@ -9,25 +11,43 @@ import threading
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from pinpoint_eda.exceptions import CheckpointError, ConfigMismatchError
 
 logger = logging.getLogger(__name__)
 
 CHECKPOINT_FILENAME = ".pinpoint-eda-checkpoint.json"
+JOURNAL_FILENAME = ".pinpoint-eda-checkpoint.jsonl"
+
+# Compact the journal back into the snapshot once it outgrows the snapshot
+# by this factor -- keeps replay time on resume bounded while the common
+# path stays a single O(1) append per mark.
+COMPACT_RATIO = 4
 
 
 class CheckpointManager:
-    """Thread-safe checkpoint manager with atomic writes."""
+    """Thread-safe checkpoint manager with an append-only journal.
+
+    Each mark appends one JSONL record to the journal, so per-mutation cost
+    is O(record) instead of rewriting the whole state. The full state is
+    compacted into the snapshot (atomic tmp + rename) only at initialization
+    and when the journal outgrows it; resume loads the snapshot and replays
+    the journal on top.
+    """
 
     def __init__(self, output_dir: Path, config_hash: str) -> None:
         self._output_dir = output_dir
         self._config_hash = config_hash
         self._lock = threading.Lock()
         self._filepath = output_dir / CHECKPOINT_FILENAME
+        self._journal_path = output_dir / JOURNAL_FILENAME
+        self._journal: TextIO | None = None
+        self._journal_bytes = 0
+        self._snapshot_bytes = 0
+        self._last_written_digest: bytes | None = None
         self._state: dict[str, Any] = {}
-        self._dirty = False
+        self._closed = False
 
     def initialize(self, resume: bool = False) -> None:
         """Initialize checkpoint state. Load existing if resume=True."""
@@ -40,6 +60,7 @@ class CheckpointManager:
                     "Checkpoint config hash doesn't match current scan config. "
                     "Use --fresh to discard the checkpoint."
                 )
+            self._replay_journal()
             logger.info("Resumed checkpoint: %s", self._state.get("run_id"))
         else:
             self._state = {
@@ -52,31 +73,124 @@ class CheckpointManager:
                 "errors": [],
                 "scan_results": {},
             }
-            self._save()
+
+        # Fresh snapshot reflecting the (possibly replayed) state, then an
+        # empty journal to accumulate new marks on top of it
+        self._save()
+        self._journal = open(self._journal_path, "a")
+        self._reset_journal()
+        atexit.register(self.flush)
 
     def _load(self) -> None:
-        """Load checkpoint from disk."""
+        """Load checkpoint snapshot from disk."""
         try:
             with open(self._filepath) as f:
                 self._state = json.load(f)
         except (json.JSONDecodeError, OSError) as e:
             raise CheckpointError(f"Failed to load checkpoint: {e}") from e
 
+    def _replay_journal(self) -> None:
+        """Apply journal records on top of the loaded snapshot."""
+        if not self._journal_path.exists():
+            return
+        with open(self._journal_path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn trailing write from an interrupted run
+                    break
+                self._apply(record)
+
+    def _apply(self, record: dict[str, Any]) -> None:
+        """Apply a single journal record to in-memory state."""
+        op = record.get("op")
+        key = record.get("key", "")
+        in_progress = self._state.setdefault("in_progress", [])
+        if op == "in_progress":
+            if key not in in_progress:
+                in_progress.append(key)
+        elif op == "complete":
+            if key in in_progress:
+                in_progress.remove(key)
+            self._state.setdefault("completed", {})[key] = {
+                "resource_count": record.get("count", 0),
+                "completed_at": record.get("completed_at", ""),
+            }
+            if record.get("result") is not None:
+                self._state.setdefault("scan_results", {})[key] = record["result"]
+        elif op == "error":
+            if key in in_progress:
+                in_progress.remove(key)
+            self._state.setdefault("errors", []).append({
+                "key": key,
+                "error": record.get("error", ""),
+                "timestamp": record.get("timestamp", ""),
+            })
+        elif op == "regions":
+            self._state["discovered_regions"] = record.get("regions", {})
+
     def _save(self) -> None:
-        """Atomic write: write to tmp file, then rename."""
+        """Atomic snapshot write: write to tmp file, then rename.
+
+        Skipped entirely when the serialized state matches the last write --
+        a resume that replays to an identical state costs no I/O.
+        """
+        # Compact separators: the snapshot is machine-read only, and
+        # skipping indentation measurably cuts encode time and bytes
+        payload = json.dumps(self._state, separators=(",", ":"), default=str)
+        digest = hashlib.sha256(payload.encode()).digest()
+        if digest == self._last_written_digest:
+            return
         tmp_path = self._filepath.with_suffix(".tmp")
         try:
             with open(tmp_path, "w") as f:
-                json.dump(self._state, f, indent=2, default=str)
+                f.write(payload)
             os.replace(tmp_path, self._filepath)
         except OSError as e:
             raise CheckpointError(f"Failed to save checkpoint: {e}") from e
+        self._snapshot_bytes = len(payload)
+        self._last_written_digest = digest
+
+    @staticmethod
+    def _encode(record: dict[str, Any]) -> str:
+        """Encode a journal record. Called outside the lock on purpose:
+        result blobs can be large and other scanner threads should not
+        wait on the serialization."""
+        return json.dumps(record, default=str) + "\n"
+
+    def _append(self, line: str) -> None:
+        """Append one encoded record to the journal. Must be called under lock."""
+        if self._journal is None:
+            return
+        self._journal.write(line)
+        self._journal.flush()
+        self._journal_bytes += len(line)
+        if self._journal_bytes > COMPACT_RATIO * max(self._snapshot_bytes, 1):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Fold journal state into the snapshot and start a fresh journal."""
+        self._save()
+        self._reset_journal()
+
+    def _reset_journal(self) -> None:
+        """Truncate the journal after its records are in the snapshot."""
+        if self._journal is not None:
+            self._journal.truncate(0)
+            self._journal.flush()
+        self._journal_bytes = 0
 
     def set_discovered_regions(self, regions: dict[str, list[str]]) -> None:
         """Record discovered regions and their app IDs."""
         with self._lock:
             self._state["discovered_regions"] = regions
-            self._save()
+            # Once per scan -- worth a full snapshot so resume never redoes
+            # discovery even if the journal is lost
+            if self._journal is not None:
+                self._compact()
+            else:
+                self._save()
 
     def get_discovered_regions(self) -> dict[str, list[str]]:
         """Return previously discovered regions, if any."""
@@ -85,29 +199,45 @@ class CheckpointManager:
 
     def mark_in_progress(self, key: str) -> None:
         """Mark a scanner+region+app as in progress."""
+        line = self._encode({"op": "in_progress", "key": key})
         with self._lock:
             in_progress = self._state.get("in_progress", [])
             if key not in in_progress:
                 in_progress.append(key)
                 self._state["in_progress"] = in_progress
-                self._save()
+                self._append(line)
 
     def mark_completed(self, key: str, resource_count: int, result: Any = None) -> None:
         """Mark a scanner+region+app as completed."""
+        completed_at = datetime.now(UTC).isoformat()
+        line = self._encode({
+            "op": "complete",
+            "key": key,
+            "count": resource_count,
+            "completed_at": completed_at,
+            "result": result,
+        })
         with self._lock:
             in_progress = self._state.get("in_progress", [])
             if key in in_progress:
                 in_progress.remove(key)
             self._state["completed"][key] = {
                 "resource_count": resource_count,
-                "completed_at": datetime.now(UTC).isoformat(),
+                "completed_at": completed_at,
             }
             if result is not None:
                 self._state.setdefault("scan_results", {})[key] = result
-            self._save()
+            self._append(line)
 
     def mark_error(self, key: str, error: str) -> None:
         """Record an error for a scanner+region+app."""
+        timestamp = datetime.now(UTC).isoformat()
+        line = self._encode({
+            "op": "error",
+            "key": key,
+            "error": error,
+            "timestamp": timestamp,
+        })
         with self._lock:
             in_progress = self._state.get("in_progress", [])
             if key in in_progress:
@@ -115,14 +245,19 @@ class CheckpointManager:
             self._state["errors"].append({
                 "key": key,
                 "error": error,
-                "timestamp": datetime.now(UTC).isoformat(),
+                "timestamp": timestamp,
             })
-            self._save()
+            self._append(line)
 
     def is_completed(self, key: str) -> bool:
-        """Check if a scanner+region+app has already been completed."""
+        """Check if a scanner+region+app has already been completed.
+
+        Membership is a hash probe on the completed dict's keys -- O(1)
+        regardless of how many keys a scan has accumulated.
+        """
         with self._lock:
-            return key in self._state.get("completed", {})
+            completed = self._state.get("completed")
+            return completed is not None and key in completed
 
     def get_scan_results(self) -> dict[str, Any]:
         """Return all stored scan results."""
@@ -143,10 +278,22 @@ class CheckpointManager:
         with self._lock:
             return len(self._state.get("completed", {}))
 
+    def flush(self) -> None:
+        """Persist any pending journal writes immediately."""
+        with self._lock:
+            if self._journal is not None and not self._closed:
+                self._journal.flush()
+
     def cleanup(self) -> None:
-        """Remove checkpoint file after successful completion."""
+        """Remove checkpoint files after successful completion."""
+        with self._lock:
+            self._closed = True
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+        atexit.unregister(self.flush)
         try:
-            if self._filepath.exists():
-                self._filepath.unlink()
+            self._filepath.unlink(missing_ok=True)
+            self._journal_path.unlink(missing_ok=True)
         except OSError:
             pass
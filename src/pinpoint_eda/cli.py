@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
 
 from pinpoint_eda import __version__
-from pinpoint_eda.config import AccountConfig, ScanConfig
 
-console = Console()
+if TYPE_CHECKING:
+    from pinpoint_eda.config import AccountConfig, ScanConfig
+
+# Only click and stdlib at module scope: --help, --version, and shell
+# completion should not pay for importing rich, pydantic, or boto3.
+# Everything heavier is imported inside the command that needs it.
+
+
+@functools.cache
+def _get_console():
+    from rich.console import Console
+
+    return Console()
 
 
 @click.group(invoke_without_command=True)
@@ -75,6 +87,8 @@ def scan(
     dry_run: bool,
 ) -> None:
     """Run a Pinpoint migration assessment scan."""
+    from pinpoint_eda.config import ScanConfig
+
     accounts = _build_accounts(profile, role_arn, external_id)
 
     config = ScanConfig(
@@ -108,6 +122,8 @@ def _build_accounts(
     - One profile + role-arns: the profile is the base session for all assumptions.
     - Multiple profiles + role-arns: error (ambiguous).
     """
+    from pinpoint_eda.config import AccountConfig
+
     if profiles and role_arns:
         if len(profiles) > 1:
             raise click.UsageError(
@@ -134,9 +150,13 @@ def _build_accounts(
     return [AccountConfig()]
 
 
-@cli.command("list-scanners")
-def list_scanners() -> None:
-    """Show available scanners and their descriptions."""
+@functools.cache
+def _scanner_table():
+    """Build the scanner listing table once per process.
+
+    The registry is plain metadata (no scanner module imports), so this
+    only saves the Rich table construction on repeated invocations.
+    """
     from rich.table import Table
 
     from pinpoint_eda.scanners import SCANNER_REGISTRY
@@ -150,7 +170,13 @@ def list_scanners() -> None:
         scope = "per-app" if meta.per_app else "account-level"
         table.add_row(name, meta.description, scope)
 
-    console.print(table)
+    return table
+
+
+@cli.command("list-scanners")
+def list_scanners() -> None:
+    """Show available scanners and their descriptions."""
+    _get_console().print(_scanner_table())
 
 
 @cli.command("report")
@@ -159,7 +185,7 @@ def report(file: str) -> None:
     """Re-render a previously generated JSON report."""
     from pinpoint_eda.report import render_report_from_file
 
-    render_report_from_file(Path(file), console)
+    render_report_from_file(Path(file), _get_console())
 
 
 @cli.command("export")
@@ -172,6 +198,7 @@ def export(file: str, output: str | None) -> None:
     """Export a JSON report to CSV files for spreadsheets."""
     from pinpoint_eda.export import export_csv
 
+    console = _get_console()
     report_path = Path(file)
     output_dir = Path(output) if output else report_path.parent
     console.print(f"[bold]Exporting[/] {report_path.name} to CSV...")
@@ -183,5 +210,5 @@ def _run_scan(config: ScanConfig) -> None:
     """Execute the scan with the given config."""
     from pinpoint_eda._orchestrator import Orchestrator
 
-    orchestrator = Orchestrator(config, console)
+    orchestrator = Orchestrator(config, _get_console())
     orchestrator.run()
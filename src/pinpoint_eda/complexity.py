@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
 from pinpoint_eda.scanners.base import ScanResult
@@ -23,6 +25,15 @@ COMPLEXITY_THRESHOLDS = {
     ComplexityLevel.VERY_HIGH: (70, float("inf")),
 }
 
+# Levels ordered by threshold so tiering is an index computation rather
+# than a branch chain; must stay in sync with COMPLEXITY_THRESHOLDS
+_LEVELS = (
+    ComplexityLevel.LOW,
+    ComplexityLevel.MEDIUM,
+    ComplexityLevel.HIGH,
+    ComplexityLevel.VERY_HIGH,
+)
+
 # Migration target mapping
 MIGRATION_TARGETS: dict[str, dict[str, str]] = {
     "campaigns": {
@@ -105,7 +116,10 @@ class AppComplexity:
     factors: list[ComplexityFactor] = field(default_factory=list)
     is_active: bool = False
 
-    def to_dict(self) -> dict[str, Any]:
+    # Assessments are frozen in practice once scoring returns them, so the
+    # serialized form is built once and shared by report and export
+    @cached_property
+    def _serialized(self) -> dict[str, Any]:
         return {
             "app_id": self.app_id,
             "app_name": self.app_name,
@@ -124,6 +138,9 @@ class AppComplexity:
             ],
         }
 
+    def to_dict(self) -> dict[str, Any]:
+        return self._serialized
+
 
 @dataclass
 class AccountComplexity:
@@ -133,7 +150,8 @@ class AccountComplexity:
     total_score: int = 0
     factors: list[ComplexityFactor] = field(default_factory=list)
 
-    def to_dict(self) -> dict[str, Any]:
+    @cached_property
+    def _serialized(self) -> dict[str, Any]:
         return {
             "region": self.region,
             "total_score": self.total_score,
@@ -148,6 +166,9 @@ class AccountComplexity:
             ],
         }
 
+    def to_dict(self) -> dict[str, Any]:
+        return self._serialized
+
 
 @dataclass
 class ComplexityAssessment:
@@ -159,7 +180,8 @@ class ComplexityAssessment:
     account_assessments: list[AccountComplexity] = field(default_factory=list)
     migration_targets: dict[str, dict[str, str]] = field(default_factory=dict)
 
-    def to_dict(self) -> dict[str, Any]:
+    @cached_property
+    def _serialized(self) -> dict[str, Any]:
         return {
             "overall_score": self.overall_score,
             "overall_level": self.overall_level.value,
@@ -168,13 +190,25 @@ class ComplexityAssessment:
             "migration_targets": self.migration_targets,
         }
 
+    def to_dict(self) -> dict[str, Any]:
+        return self._serialized
+
 
 def _score_to_level(score: int) -> ComplexityLevel:
     """Convert a numeric score to a complexity level."""
-    for level, (low, high) in COMPLEXITY_THRESHOLDS.items():
-        if low <= score < high:
-            return level
-    return ComplexityLevel.VERY_HIGH
+    return _LEVELS[(score >= 10) + (score >= 30) + (score >= 70)]
+
+
+# Base journey score by state -- ACTIVE journeys are the riskiest to move;
+# a table lookup keeps the hot scoring loop free of branch chains
+_STATE_BASE = {
+    "DRAFT": 1,
+    "ACTIVE": 5,
+    "PAUSED": 2,
+    "CANCELLED": 2,
+    "COMPLETED": 3,
+    "CLOSED": 3,
+}
 
 
 def _score_journey(jc: dict) -> tuple[int, str]:
@@ -188,26 +222,11 @@ def _score_journey(jc: dict) -> tuple[int, str]:
     integration_count = jc.get("integration_count", 0)
     name = jc.get("name", jc.get("id", "?"))
 
-    # Base score by state
-    if state == "DRAFT":
-        base = 1
-    elif state == "ACTIVE":
-        base = 5
-    elif state in ("PAUSED", "CANCELLED"):
-        base = 2
-    elif state in ("COMPLETED", "CLOSED"):
-        base = 3
-    else:
-        base = 2
-
-    # Activity count adds complexity (each activity is a step to rebuild)
-    activity_score = 0
-    if activity_count <= 3:
-        activity_score = 1
-    elif activity_count <= 10:
-        activity_score = 3
-    else:
-        activity_score = 5
+    base = _STATE_BASE.get(state, 2)
+
+    # Activity count adds complexity (each activity is a step to rebuild):
+    # 1 for <=3, 3 for 4-10, 5 beyond -- computed branchlessly
+    activity_score = 1 + 2 * ((activity_count > 3) + (activity_count > 10))
 
     # Branching adds significant complexity (conditional logic to recreate)
     branching_score = branching_count * 2
@@ -217,24 +236,28 @@ def _score_journey(jc: dict) -> tuple[int, str]:
 
     total = base + activity_score + branching_score + integration_score
 
-    parts = [f'"{name}" ({state.lower()}, {activity_count} activities']
+    explanation = f'"{name}" ({state.lower()}, {activity_count} activities'
     if branching_count:
-        parts[0] += f", {branching_count} branches"
+        explanation += f", {branching_count} branches"
     if integration_count:
-        parts[0] += f", {integration_count} integrations"
-    parts[0] += ")"
+        explanation += f", {integration_count} integrations"
+    explanation += ")"
 
-    return total, parts[0]
+    return total, explanation
 
 
 def _assess_account_resources(
     region: str,
     results: list[ScanResult],
 ) -> AccountComplexity:
-    """Score account-level resources (templates, recommenders, sms_voice_v2)."""
+    """Score account-level resources (templates, recommenders, sms_voice_v2).
+
+    ``results`` holds only account-level ScanResults; the scanner-name dict
+    makes each factor block below an O(1) lookup rather than a scan.
+    """
     factors: list[ComplexityFactor] = []
 
-    by_scanner = {r.scanner_name: r for r in results if r.app_id == "account"}
+    by_scanner = {r.scanner_name: r for r in results}
 
     # Templates: 1 pt each, in-app = 8 pts each
     templates_result = by_scanner.get("templates")
@@ -302,15 +325,15 @@ def _assess_app(
     region: str,
     results: list[ScanResult],
 ) -> AppComplexity:
-    """Score a single application's migration complexity (per-app resources only)."""
+    """Score a single application's migration complexity.
+
+    ``results`` holds only this app's ScanResults -- the caller groups by
+    app_id once, so scoring N apps stays O(results) overall.
+    """
     app_name = app_id
     factors: list[ComplexityFactor] = []
 
-    # Only per-app results (exclude account-level)
-    by_scanner: dict[str, ScanResult] = {}
-    for r in results:
-        if r.app_id == app_id:
-            by_scanner[r.scanner_name] = r
+    by_scanner = {r.scanner_name: r for r in results}
 
     # Get app name
     app_result = by_scanner.get("applications")
@@ -483,10 +506,11 @@ def assess_complexity(
     account_assessments: list[AccountComplexity] = []
 
     for region_key, scan_results in results.items():
-        # Group results by app_id
-        apps: dict[str, list[ScanResult]] = {}
+        # Group results by app_id in one pass; "account" lands in its own
+        # bucket and is scored separately below
+        apps: defaultdict[str, list[ScanResult]] = defaultdict(list)
         for r in scan_results:
-            apps.setdefault(r.app_id, []).append(r)
+            apps[r.app_id].append(r)
 
         # Parse region from key
         parts = region_key.split(":", 1)
@@ -495,7 +519,7 @@ def assess_complexity(
         # Score account-level resources once per region
         account_results = apps.get("account", [])
         if account_results:
-            acct_assessment = _assess_account_resources(region, scan_results)
+            acct_assessment = _assess_account_resources(region, account_results)
             if acct_assessment.total_score > 0:
                 account_assessments.append(acct_assessment)
 
@@ -503,7 +527,7 @@ def assess_complexity(
         for app_id, app_results in apps.items():
             if app_id == "account":
                 continue
-            assessment = _assess_app(app_id, region, scan_results)
+            assessment = _assess_app(app_id, region, app_results)
             app_assessments.append(assessment)
 
     app_total = sum(a.total_score for a in app_assessments)
@@ -6,12 +6,16 @@ import hashlib
 import json
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class AccountConfig(BaseModel):
     """Configuration for a single AWS account."""
 
+    # Accounts never change after CLI parsing; freezing makes instances
+    # hashable and safe to share across scanner threads
+    model_config = ConfigDict(frozen=True)
+
     profile: str | None = None
     role_arn: str | None = None
     external_id: str | None = None
@@ -45,14 +49,20 @@ class ScanConfig(BaseModel):
     no_sms_voice_v2: bool = False
     dry_run: bool = False
 
+    # The config is never mutated after CLI parsing, so the hash is
+    # computed once and memoized
+    _cached_hash: str | None = PrivateAttr(default=None)
+
     def config_hash(self) -> str:
         """Deterministic hash of config for checkpoint matching."""
-        key_fields = {
-            "accounts": [a.model_dump() for a in self.accounts],
-            "regions": sorted(self.regions),
-            "app_ids": sorted(self.app_ids),
-            "scanners": sorted(self.scanners),
-            "no_sms_voice_v2": self.no_sms_voice_v2,
-        }
-        blob = json.dumps(key_fields, sort_keys=True)
-        return hashlib.sha256(blob.encode()).hexdigest()[:16]
+        if self._cached_hash is None:
+            key_fields = {
+                "accounts": [a.model_dump() for a in self.accounts],
+                "regions": sorted(self.regions),
+                "app_ids": sorted(self.app_ids),
+                "scanners": sorted(self.scanners),
+                "no_sms_voice_v2": self.no_sms_voice_v2,
+            }
+            blob = json.dumps(key_fields, sort_keys=True)
+            self._cached_hash = hashlib.sha256(blob.encode()).hexdigest()[:16]
+        return self._cached_hash
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-import configparser
+import functools
+import os
+import re
+from collections.abc import Iterator
 from pathlib import Path
 
 import questionary
@@ -56,29 +59,76 @@ def run_configurator() -> ScanConfig | None:
         return None
 
 
-def _discover_aws_profiles() -> list[str]:
-    """Discover AWS profiles from ~/.aws/config and ~/.aws/credentials."""
+def _file_key(entry: os.DirEntry | None) -> tuple[str, int, int] | None:
+    """Identity key (path, mtime_ns, size) for a dir entry, or None if missing."""
+    if entry is None:
+        return None
+    try:
+        st = entry.stat()
+    except OSError:
+        return None
+    return (entry.path, st.st_mtime_ns, st.st_size)
+
+
+# Section headers like "[profile foo]" or "[default]" are all the
+# discovery needs -- no key/value parsing
+_SECTION_RE = re.compile(rb"^\[([^\]]+)\]\s*$", re.MULTILINE)
+
+
+def _section_names(path: str) -> Iterator[str]:
+    """Yield INI section names from a file via one regex pass."""
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return
+    for m in _SECTION_RE.finditer(data):
+        yield m.group(1).decode("utf-8", "replace").strip()
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_aws_profiles(
+    config_key: tuple[str, int, int] | None,
+    creds_key: tuple[str, int, int] | None,
+) -> tuple[str, ...]:
+    """Parse profile names for the given config/credentials file keys.
+
+    A regex scan for section headers replaces configparser, which built a
+    full parsed model just to throw everything but the section names away.
+    """
     profiles: set[str] = set()
 
-    config_path = Path.home() / ".aws" / "config"
-    if config_path.exists():
-        parser = configparser.ConfigParser()
-        parser.read(config_path)
-        for section in parser.sections():
+    if config_key is not None:
+        for section in _section_names(config_key[0]):
             # Sections are "profile foo" or "default"
             if section.startswith("profile "):
                 profiles.add(section.removeprefix("profile "))
             elif section == "default":
                 profiles.add("default")
 
-    creds_path = Path.home() / ".aws" / "credentials"
-    if creds_path.exists():
-        parser = configparser.ConfigParser()
-        parser.read(creds_path)
-        for section in parser.sections():
-            profiles.add(section)
+    if creds_key is not None:
+        profiles.update(_section_names(creds_key[0]))
+
+    return tuple(sorted(profiles))
+
 
-    return sorted(profiles)
+def _discover_aws_profiles() -> list[str]:
+    """Discover AWS profiles from ~/.aws/config and ~/.aws/credentials.
+
+    Parsing is cached on (path, mtime, size) so repeated prompts within a
+    wizard session only re-read the files when they actually change.
+    """
+    # One scandir pass probes both files with cached stat results --
+    # fewer syscalls than exists() + stat() per file, and a missing
+    # ~/.aws directory bails out before touching anything else
+    try:
+        with os.scandir(Path.home() / ".aws") as it:
+            entries = {e.name: e for e in it}
+    except OSError:
+        return []
+    return list(_parse_aws_profiles(
+        _file_key(entries.get("config")),
+        _file_key(entries.get("credentials")),
+    ))
 
 
 def _configure_accounts() -> list[AccountConfig] | None:
@@ -13,13 +13,42 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor that records peak work-queue depth.
+
+    Used for the shared scanner I/O pool so results can report how
+    saturated the pool got, letting users right-size --max-workers
+    against Pinpoint's TPS limits instead of guessing.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.peak_queue_depth = 0
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future:
+        future = super().submit(fn, *args, **kwargs)
+        # qsize is approximate under concurrency; good enough for tuning hints
+        depth = self._work_queue.qsize()
+        if depth > self.peak_queue_depth:
+            self.peak_queue_depth = depth
+        return future
+
+
 class ScanExecutor:
-    """Manages thread-based parallelism for scanning operations."""
+    """Manages thread-based parallelism for scanning operations.
+
+    Threads are deliberate: the mapped work is boto3 network I/O (the GIL
+    is released while waiting) and the scan closures capture live clients
+    and progress state that cannot cross a process boundary. Complexity
+    scoring, the only CPU-bound pass, runs once after the scan and is not
+    dispatched through this executor.
+    """
 
     def __init__(self, max_workers: int = 5) -> None:
         self._max_workers = max_workers
         self._shutdown_event = threading.Event()
-        self._executor: ThreadPoolExecutor | None = None
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
 
     @property
     def should_stop(self) -> bool:
@@ -29,44 +58,73 @@ class ScanExecutor:
         """Signal all threads to stop gracefully."""
         self._shutdown_event.set()
 
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Return the long-lived pool, creating it on first use.
+
+        One pool serves every map_parallel call so thread startup is paid
+        once per scan rather than once per region batch.
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="pp-scan",
+                )
+            return self._pool
+
     def map_parallel(
         self,
         func: Callable[..., T],
         items: list[Any],
-        max_workers: int | None = None,
     ) -> list[tuple[Any, T | None, Exception | None]]:
         """Execute func for each item in parallel, returning (item, result, error) tuples.
 
         Results are returned in completion order.
         """
-        workers = max_workers or self._max_workers
-        results: list[tuple[Any, T | None, Exception | None]] = []
+        if not items or self._shutdown_event.is_set():
+            return []
 
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            self._executor = executor
-            future_to_item: dict[Future, Any] = {}
+        results: list[tuple[Any, T | None, Exception | None]] = []
+        pool = self._get_pool()
+        future_to_item: dict[Future, Any] = {}
+
+        for item in items:
+            if self._shutdown_event.is_set():
+                break
+            future = pool.submit(func, item)
+            future_to_item[future] = item
+
+        for future in as_completed(future_to_item):
+            if self._shutdown_event.is_set():
+                # Stop draining and cancel whatever has not started yet;
+                # already-running futures finish on their own
+                for pending in future_to_item:
+                    pending.cancel()
+                break
+            item = future_to_item[future]
+            try:
+                result = future.result()
+                results.append((item, result, None))
+            except Exception as e:
+                logger.error("Error processing %s: %s", item, e)
+                results.append((item, None, e))
 
-            for item in items:
-                if self._shutdown_event.is_set():
-                    break
-                future = executor.submit(func, item)
-                future_to_item[future] = item
+        return results
 
-            for future in as_completed(future_to_item):
-                item = future_to_item[future]
-                try:
-                    result = future.result()
-                    results.append((item, result, None))
-                except Exception as e:
-                    logger.error("Error processing %s: %s", item, e)
-                    results.append((item, None, e))
+    def close(self) -> None:
+        """Shut down the long-lived pool."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
 
-            self._executor = None
+    def __enter__(self) -> ScanExecutor:
+        return self
 
-        return results
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def shutdown(self) -> None:
-        """Force shutdown the executor."""
+        """Force shutdown: stop accepting work and cancel what is queued."""
         self._shutdown_event.set()
-        if self._executor:
-            self._executor.shutdown(wait=False, cancel_futures=True)
+        self.close()
@@ -14,16 +14,26 @@ logger = logging.getLogger(__name__)
 
 
 def export_csv(report_path: Path, output_dir: Path, console: Console) -> None:
-    """Export a JSON report to CSV files.
+    """Export a JSON report file to CSV files.
 
     Produces:
       - applications.csv  -- one row per app with complexity scores
       - inventory.csv     -- one row per app+scanner with resource counts and metadata
       - account_resources.csv -- account-level resources per region
     """
-    with open(report_path) as f:
-        report = json.load(f)
+    _write_csvs(_load_report(report_path), output_dir, console)
 
+
+def _load_report(report_path: Path) -> dict[str, Any]:
+    """Load a JSON report from disk."""
+    return json.loads(report_path.read_bytes())
+
+
+def _write_csvs(report: dict[str, Any], output_dir: Path, console: Console) -> None:
+    """Write the three CSV exports for an already-loaded report dict.
+
+    Split from export_csv so callers that already hold the report in
+    memory skip the serialize-to-disk-and-reparse round trip."""
     output_dir.mkdir(parents=True, exist_ok=True)
 
     apps_path = output_dir / "applications.csv"
@@ -50,28 +60,32 @@ def _write_applications_csv(report: dict[str, Any], path: Path) -> None:
         "migration_notes",
     ]
 
+    # Rows are assembled up front so each file is one writeheader plus one
+    # batched writerows instead of a write call per row
+    rows = []
+    for app in app_assessments:
+        factors = app.get("factors", [])
+        top = "; ".join(
+            f"{fa['name']} ({fa['score']}pts)" for fa in factors[:5]
+        )
+        targets = "; ".join(
+            fa["migration_target"] for fa in factors if fa.get("migration_target")
+        )
+        rows.append({
+            "region": app["region"],
+            "app_id": app["app_id"],
+            "app_name": app["app_name"],
+            "is_active": app.get("is_active", False),
+            "complexity_score": app["total_score"],
+            "complexity_level": app["level"],
+            "top_factors": top,
+            "migration_notes": targets,
+        })
+
     with open(path, "w", newline="") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
-
-        for app in app_assessments:
-            factors = app.get("factors", [])
-            top = "; ".join(
-                f"{fa['name']} ({fa['score']}pts)" for fa in factors[:5]
-            )
-            targets = "; ".join(
-                fa["migration_target"] for fa in factors if fa.get("migration_target")
-            )
-            writer.writerow({
-                "region": app["region"],
-                "app_id": app["app_id"],
-                "app_name": app["app_name"],
-                "is_active": app.get("is_active", False),
-                "complexity_score": app["total_score"],
-                "complexity_level": app["level"],
-                "top_factors": top,
-                "migration_notes": targets,
-            })
+        writer.writerows(rows)
 
 
 def _write_inventory_csv(report: dict[str, Any], path: Path) -> None:
@@ -114,8 +128,7 @@ def _write_inventory_csv(report: dict[str, Any], path: Path) -> None:
     with open(path, "w", newline="") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
         writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+        writer.writerows(rows)
 
 
 def _write_account_csv(report: dict[str, Any], path: Path) -> None:
@@ -133,35 +146,37 @@ def _write_account_csv(report: dict[str, Any], path: Path) -> None:
         "complexity_score", "factors", "metadata",
     ]
 
+    rows = []
+    for region_key, apps in inventory.items():
+        account_data = apps.get("account", {})
+        if not account_data:
+            continue
+
+        # Parse region from key (e.g., "131578276461:us-east-1" -> "us-east-1")
+        parts = region_key.split(":", 1)
+        region = parts[1] if len(parts) > 1 else region_key
+
+        acct_assessment = acct_scores.get(region, {})
+        factors_str = "; ".join(
+            f"{fa['name']} ({fa['score']}pts)"
+            for fa in acct_assessment.get("factors", [])
+        )
+
+        for scanner_name, data in account_data.items():
+            meta = data.get("metadata", {})
+            rows.append({
+                "region_key": region_key,
+                "scanner": scanner_name,
+                "resource_count": data.get("resource_count", 0),
+                "complexity_score": acct_assessment.get("total_score", 0),
+                "factors": factors_str,
+                "metadata": json.dumps(meta, default=str),
+            })
+
     with open(path, "w", newline="") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
-
-        for region_key, apps in inventory.items():
-            account_data = apps.get("account", {})
-            if not account_data:
-                continue
-
-            # Parse region from key (e.g., "131578276461:us-east-1" -> "us-east-1")
-            parts = region_key.split(":", 1)
-            region = parts[1] if len(parts) > 1 else region_key
-
-            acct_assessment = acct_scores.get(region, {})
-            factors_str = "; ".join(
-                f"{fa['name']} ({fa['score']}pts)"
-                for fa in acct_assessment.get("factors", [])
-            )
-
-            for scanner_name, data in account_data.items():
-                meta = data.get("metadata", {})
-                writer.writerow({
-                    "region_key": region_key,
-                    "scanner": scanner_name,
-                    "resource_count": data.get("resource_count", 0),
-                    "complexity_score": acct_assessment.get("total_score", 0),
-                    "factors": factors_str,
-                    "metadata": json.dumps(meta, default=str),
-                })
+        writer.writerows(rows)
 
 
 def _flatten_metadata(meta: dict[str, Any], prefix: str = "") -> dict[str, str]:
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import Any
 
 from pinpoint_eda.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Pinpoint caps PageSize/MaxResults at 100 for its list/get operations --
+# always request the maximum so a scan uses the fewest round trips.
+MAX_PAGE_SIZE = 100
+
 # API methods that use top-level NextToken instead of nested Token
 TOP_LEVEL_TOKEN_METHODS = {
     "list_templates",
@@ -29,16 +33,19 @@ NESTED_TOKEN_METHODS = {
 }
 
 
-def paginate_pinpoint(
+def paginate_pinpoint_iter(
     api_method: Callable,
     rate_limiter: RateLimiter,
     response_key: str,
     items_key: str = "Item",
-    page_size: int = 100,
+    page_size: int = MAX_PAGE_SIZE,
     progress_callback: Callable[[int, int], None] | None = None,
     **api_kwargs: Any,
-) -> list[dict]:
-    """Generic Pinpoint paginator with progress callbacks.
+) -> Iterator[dict]:
+    """Generator variant of paginate_pinpoint.
+
+    Yields items as each page arrives so callers can start processing
+    (or submitting concurrent work) without waiting for the full list.
 
     Args:
         api_method: The boto3 API method to call.
@@ -49,12 +56,12 @@ def paginate_pinpoint(
         progress_callback: Called with (items_so_far, page_num) after each page.
         **api_kwargs: Additional arguments passed to the API method.
 
-    Returns:
-        List of all items across all pages.
+    Yields:
+        Each item across all pages, in order.
     """
-    all_items: list[dict] = []
     token: str | None = None
     page_num = 0
+    items_seen = 0
     method_name = getattr(api_method, "__name__", "")
 
     while True:
@@ -68,10 +75,12 @@ def paginate_pinpoint(
         # Extract items from response
         nested = response.get(response_key, {})
         items = nested.get(items_key, [])
-        all_items.extend(items)
+        items_seen += len(items)
 
         if progress_callback:
-            progress_callback(len(all_items), page_num)
+            progress_callback(items_seen, page_num)
+
+        yield from items
 
         # Check for next page
         next_token = nested.get("NextToken")
@@ -82,28 +91,54 @@ def paginate_pinpoint(
     logger.debug(
         "%s: fetched %d items across %d pages",
         method_name,
-        len(all_items),
+        items_seen,
         page_num,
     )
-    return all_items
 
 
-def paginate_list(
+def paginate_pinpoint(
     api_method: Callable,
     rate_limiter: RateLimiter,
     response_key: str,
     items_key: str = "Item",
-    page_size: int = 100,
+    page_size: int = MAX_PAGE_SIZE,
     progress_callback: Callable[[int, int], None] | None = None,
     **api_kwargs: Any,
 ) -> list[dict]:
-    """Paginator for list_* operations that use top-level NextToken.
+    """Generic Pinpoint paginator with progress callbacks.
+
+    Materialized convenience wrapper around paginate_pinpoint_iter.
+
+    Returns:
+        List of all items across all pages.
+    """
+    return list(paginate_pinpoint_iter(
+        api_method=api_method,
+        rate_limiter=rate_limiter,
+        response_key=response_key,
+        items_key=items_key,
+        page_size=page_size,
+        progress_callback=progress_callback,
+        **api_kwargs,
+    ))
+
+
+def paginate_list_iter(
+    api_method: Callable,
+    rate_limiter: RateLimiter,
+    response_key: str,
+    items_key: str = "Item",
+    page_size: int = MAX_PAGE_SIZE,
+    progress_callback: Callable[[int, int], None] | None = None,
+    **api_kwargs: Any,
+) -> Iterator[dict]:
+    """Generator variant of paginate_list for top-level NextToken operations.
 
     Used for list_templates, list_journeys, etc.
     """
-    all_items: list[dict] = []
     token: str | None = None
     page_num = 0
+    items_seen = 0
 
     while True:
         kwargs = {**api_kwargs, "PageSize": str(page_size)}
@@ -115,17 +150,41 @@ def paginate_list(
 
         nested = response.get(response_key, {})
         items = nested.get(items_key, [])
-        all_items.extend(items)
+        items_seen += len(items)
 
         if progress_callback:
-            progress_callback(len(all_items), page_num)
+            progress_callback(items_seen, page_num)
+
+        yield from items
 
         next_token = nested.get("NextToken") or response.get("NextToken")
         if not next_token or not items:
             break
         token = next_token
 
-    return all_items
+
+def paginate_list(
+    api_method: Callable,
+    rate_limiter: RateLimiter,
+    response_key: str,
+    items_key: str = "Item",
+    page_size: int = MAX_PAGE_SIZE,
+    progress_callback: Callable[[int, int], None] | None = None,
+    **api_kwargs: Any,
+) -> list[dict]:
+    """Paginator for list_* operations that use top-level NextToken.
+
+    Materialized convenience wrapper around paginate_list_iter.
+    """
+    return list(paginate_list_iter(
+        api_method=api_method,
+        rate_limiter=rate_limiter,
+        response_key=response_key,
+        items_key=items_key,
+        page_size=page_size,
+        progress_callback=progress_callback,
+        **api_kwargs,
+    ))
 
 
 def paginate_v2(
@@ -133,7 +192,7 @@ def paginate_v2(
     method_name: str,
     rate_limiter: RateLimiter,
     result_key: str,
-    max_results: int = 100,
+    max_results: int = MAX_PAGE_SIZE,
     progress_callback: Callable[[int, int], None] | None = None,
     **api_kwargs: Any,
 ) -> list[dict]:
@@ -141,7 +200,14 @@ def paginate_v2(
     all_items: list[dict] = []
     page_num = 0
 
+    # Ask the client up front rather than catching a get_paginator failure --
+    # mocked or stripped-down clients land on the manual path cleanly.
     try:
+        use_paginator = client.can_paginate(method_name) is True
+    except Exception:
+        use_paginator = False
+
+    if use_paginator:
         paginator = client.get_paginator(method_name)
         for page in paginator.paginate(
             **api_kwargs,
@@ -152,23 +218,22 @@ def paginate_v2(
             all_items.extend(items)
             if progress_callback:
                 progress_callback(len(all_items), page_num)
-    except client.exceptions.ClientError:
-        raise
-    except Exception:
-        # Fallback: manual pagination if paginator not available
-        token = None
-        while True:
-            kwargs = {**api_kwargs, "MaxResults": max_results}
-            if token:
-                kwargs["NextToken"] = token
-            response = rate_limiter.call_with_retry(getattr(client, method_name), **kwargs)
-            page_num += 1
-            items = response.get(result_key, [])
-            all_items.extend(items)
-            if progress_callback:
-                progress_callback(len(all_items), page_num)
-            token = response.get("NextToken")
-            if not token or not items:
-                break
+        return all_items
+
+    # Fallback: manual pagination if paginator not available
+    token = None
+    while True:
+        kwargs = {**api_kwargs, "MaxResults": max_results}
+        if token:
+            kwargs["NextToken"] = token
+        response = rate_limiter.call_with_retry(getattr(client, method_name), **kwargs)
+        page_num += 1
+        items = response.get(result_key, [])
+        all_items.extend(items)
+        if progress_callback:
+            progress_callback(len(all_items), page_num)
+        token = response.get("NextToken")
+        if not token or not items:
+            break
 
     return all_items
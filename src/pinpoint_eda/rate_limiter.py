@@ -28,15 +28,30 @@ THROTTLE_ERROR_CODES = {
 MAX_RETRIES = 5
 BASE_DELAY = 0.5
 
+# AIMD tuning: halve the rate on a throttle, creep back up by one step
+# after a streak of clean calls, never above the configured rate
+MIN_RATE = 1.0
+RECOVERY_SUCCESSES = 100
+RECOVERY_STEP_FRACTION = 0.1
+
 
 class RateLimiter:
-    """Thread-safe token-bucket rate limiter with adaptive backoff."""
+    """Thread-safe token-bucket rate limiter with adaptive backoff.
+
+    The bucket rate is AIMD-adjusted from observed responses: any
+    throttle halves it (multiplicative decrease), a streak of
+    RECOVERY_SUCCESSES clean calls adds a step back (additive increase),
+    capped at the configured requests_per_second. Pinpoint's real Get*
+    ceilings are undocumented, so a static rate either wastes headroom
+    or throttles constantly."""
 
     def __init__(self, requests_per_second: float = 50.0) -> None:
         self._lock = threading.Lock()
         self._tokens = requests_per_second
         self._max_tokens = requests_per_second
         self._refill_rate = requests_per_second
+        self._base_rate = requests_per_second
+        self._success_streak = 0
         self._last_refill = time.monotonic()
         self._total_calls = 0
         self._total_retries = 0
@@ -61,13 +76,37 @@ class RateLimiter:
         self._tokens = min(self._max_tokens, self._tokens + elapsed * self._refill_rate)
         self._last_refill = now
 
+    def _on_throttle(self) -> None:
+        """Multiplicative decrease: halve the rate, floor at MIN_RATE."""
+        with self._lock:
+            new_rate = max(MIN_RATE, self._refill_rate / 2)
+            self._refill_rate = new_rate
+            self._max_tokens = new_rate
+            self._tokens = min(self._tokens, new_rate)
+            self._success_streak = 0
+
+    def _on_success(self) -> None:
+        """Additive increase after a sustained clean streak."""
+        with self._lock:
+            if self._refill_rate >= self._base_rate:
+                return
+            self._success_streak += 1
+            if self._success_streak >= RECOVERY_SUCCESSES:
+                step = self._base_rate * RECOVERY_STEP_FRACTION
+                new_rate = min(self._base_rate, self._refill_rate + step)
+                self._refill_rate = new_rate
+                self._max_tokens = new_rate
+                self._success_streak = 0
+
     def call_with_retry(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
         """Call with rate limiting + exponential backoff on throttling."""
         last_exception = None
         for attempt in range(MAX_RETRIES + 1):
             self.acquire()
             try:
-                return func(*args, **kwargs)
+                result = func(*args, **kwargs)
+                self._on_success()
+                return result
             except ClientError as e:
                 error_code = e.response.get("Error", {}).get("Code", "")
                 status_code = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
@@ -79,6 +118,8 @@ class RateLimiter:
 
                 last_exception = e
                 self._total_retries += 1
+                if is_throttle:
+                    self._on_throttle()
 
                 if attempt < MAX_RETRIES:
                     delay = BASE_DELAY * (2**attempt)
@@ -96,6 +137,12 @@ class RateLimiter:
             f"Rate limit exceeded after {MAX_RETRIES} retries"
         ) from last_exception
 
+    @property
+    def current_rate(self) -> float:
+        """The AIMD-adjusted bucket rate in requests per second."""
+        with self._lock:
+            return self._refill_rate
+
     @property
     def throughput(self) -> float:
         """Current throughput in calls per second."""
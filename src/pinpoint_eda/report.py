@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 from datetime import UTC, date, datetime
@@ -55,8 +56,9 @@ def generate_report(
     output_dir = config.output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
     json_path = output_dir / "pinpoint-eda-report.json"
-    with open(json_path, "w") as f:
-        json.dump(report_data, f, indent=2, default=str)
+    # Encode once and write bytes -- skips the text-mode codec layer and
+    # json.dump's chunked writes through the file wrapper
+    json_path.write_bytes(json.dumps(report_data, indent=2, default=str).encode())
 
     if not config.json_only:
         _render_console_summary(report_data, complexity, console)
@@ -64,10 +66,21 @@ def generate_report(
     console.print(f"\n[bold green]Report saved to:[/] {json_path}")
 
 
+@functools.lru_cache(maxsize=16)
+def _load_report_file(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a report file, cached on (path, mtime).
+
+    Repeated renders of the same unchanged report -- e.g. report followed
+    by export in one session -- skip the re-parse; an edited file gets a
+    new mtime and a fresh entry."""
+    # One read + parse of the whole buffer beats json.load's incremental
+    # reads for a file this shape
+    return json.loads(Path(path_str).read_bytes())
+
+
 def render_report_from_file(file_path: Path, console: Console) -> None:
     """Re-render a previously saved JSON report."""
-    with open(file_path) as f:
-        report_data = json.load(f)
+    report_data = _load_report_file(str(file_path), file_path.stat().st_mtime_ns)
 
     from pinpoint_eda.complexity import AppComplexity, ComplexityFactor
 
@@ -25,23 +25,29 @@ class ApplicationsScanner(BaseScanner):
                 ApplicationId=self.app_id,
             )
             app = response.get("ApplicationResponse", {})
+            _g = app.get
             result.resources = [app]
             result.resource_count = 1
             result.metadata = {
-                "name": app.get("Name", ""),
-                "arn": app.get("Arn", ""),
-                "creation_date": app.get("CreationDate", ""),
+                "name": _g("Name", ""),
+                "arn": _g("Arn", ""),
+                "creation_date": _g("CreationDate", ""),
             }
 
-            # Try to get tags
-            try:
-                tags_response = self.rate_limiter.call_with_retry(
-                    self.client.list_tags_for_resource,
-                    ResourceArn=app.get("Arn", ""),
-                )
-                result.metadata["tags"] = tags_response.get("TagsModel", {}).get("tags", {})
-            except Exception:
-                result.metadata["tags"] = {}
+            # Newer SDKs return tags directly on the GetApp response; only
+            # fall back to list_tags_for_resource when the key is absent.
+            # An inline empty dict means "untagged", not "unknown".
+            tags = app.get("tags", app.get("Tags"))
+            if tags is None:
+                try:
+                    tags_response = self.rate_limiter.call_with_retry(
+                        self.client.list_tags_for_resource,
+                        ResourceArn=_g("Arn", ""),
+                    )
+                    tags = tags_response.get("TagsModel", {}).get("tags", {})
+                except Exception:
+                    tags = {}
+            result.metadata["tags"] = tags or {}
 
             self._increment_stat("Applications", 1)
         except Exception as e:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -52,6 +53,7 @@ class BaseScanner(ABC):
         app_id: str = "",
         progress: ProgressDisplay | None = None,
         kpi_days: int = 90,
+        io_pool: ThreadPoolExecutor | None = None,
     ) -> None:
         self.client = client
         self.rate_limiter = rate_limiter
@@ -59,11 +61,35 @@ class BaseScanner(ABC):
         self.app_id = app_id
         self.progress = progress
         self.kpi_days = kpi_days
+        # Shared pool for intra-scanner I/O fan-out. Created once by the
+        # orchestrator so thread startup is amortized over the whole scan;
+        # scanners fall back to sequential calls when it is None.
+        # Threads over async on purpose: boto3 is synchronous, the fan-out is
+        # pure network wait (threads release the GIL there), and connection
+        # reuse already comes from the shared botocore pool in aws_session.
+        self.io_pool = io_pool
 
     @abstractmethod
     def scan(self) -> ScanResult:
         """Execute the scan and return results."""
 
+    def pool_stats(self) -> dict[str, int] | None:
+        """Saturation stats for the shared I/O pool, or None when sequential.
+
+        The orchestrator attaches these to result metadata so users can
+        right-size --max-workers from real queue depth and throttle counts.
+        """
+        if self.io_pool is None:
+            return None
+        stats: dict[str, int] = {
+            "max_workers": self.io_pool._max_workers,
+            "throttles": self.rate_limiter.total_retries,
+        }
+        peak = getattr(self.io_pool, "peak_queue_depth", None)
+        if peak is not None:
+            stats["peak_queue"] = peak
+        return stats
+
     def _update_status(self, message: str) -> None:
         """Update the progress display status line."""
         if self.progress:
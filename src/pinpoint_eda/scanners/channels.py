@@ -38,6 +38,15 @@ class ChannelsScanner(BaseScanner):
     description = "All channel types (Email, SMS, Voice, APNS, GCM, etc.)"
     per_app = True
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Resolve bound methods once per instance -- botocore's __getattr__
+        # synthesizes client methods from the service model on each lookup.
+        self._channel_methods = {
+            channel_type: getattr(self.client, method_name)
+            for channel_type, method_name in CHANNEL_TYPES.items()
+        }
+
     def scan(self) -> ScanResult:
         self._update_status(f"Scanning channels for {self.app_id}")
 
@@ -50,23 +59,26 @@ class ChannelsScanner(BaseScanner):
         active_channels = []
         all_channels = []
 
-        for channel_type, method_name in CHANNEL_TYPES.items():
+        response_keys = CHANNEL_RESPONSE_KEYS
+        for channel_type, method in self._channel_methods.items():
             try:
-                method = getattr(self.client, method_name)
                 response = self.rate_limiter.call_with_retry(
                     method,
                     ApplicationId=self.app_id,
                 )
-                response_key = CHANNEL_RESPONSE_KEYS[channel_type]
+                response_key = response_keys[channel_type]
                 channel_data = response.get(response_key, {})
+                # Bind .get once -- this runs 10x per app across a large scan
+                _g = channel_data.get
+                enabled = _g("Enabled", False)
                 channel_info = {
                     "type": channel_type,
-                    "enabled": channel_data.get("Enabled", False),
-                    "is_archived": channel_data.get("IsArchived", False),
+                    "enabled": enabled,
+                    "is_archived": _g("IsArchived", False),
                     "data": channel_data,
                 }
                 all_channels.append(channel_info)
-                if channel_data.get("Enabled", False):
+                if enabled:
                     active_channels.append(channel_type)
             except Exception as e:
                 error_code = ""
@@ -25,11 +25,12 @@ class EventStreamsScanner(BaseScanner):
                 ApplicationId=self.app_id,
             )
             stream = response.get("EventStream", {})
+            _g = stream.get
             result.resources = [stream]
             result.resource_count = 1
             result.metadata = {
-                "destination_stream_arn": stream.get("DestinationStreamArn", ""),
-                "role_arn": stream.get("RoleArn", ""),
+                "destination_stream_arn": _g("DestinationStreamArn", ""),
+                "role_arn": _g("RoleArn", ""),
                 "has_event_stream": True,
             }
             self._increment_stat("Event Streams", 1)
@@ -2,13 +2,45 @@
 
 from __future__ import annotations
 
-from pinpoint_eda.pagination import paginate_list
+from collections import Counter
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+
+from pinpoint_eda.pagination import paginate_list_iter
 from pinpoint_eda.scanners.base import BaseScanner, ScanResult
 
 # Activity types that add branching complexity
 BRANCHING_ACTIVITIES = {"ConditionalSplit", "MultiCondition", "RandomSplit"}
 # Activity types that involve external integrations
 INTEGRATION_ACTIVITIES = {"ContactCenter", "Custom"}
+# States for which execution metrics are available
+EXECUTED_STATES = {"ACTIVE", "COMPLETED", "CLOSED"}
+# All known activity type keys; an activity dict carries exactly one of these
+ACTIVITY_TYPES = frozenset({
+    "ConditionalSplit", "Email", "Holdout", "MultiCondition",
+    "Push", "RandomSplit", "SMS", "Wait", "ContactCenter",
+    "Custom", "Voice",
+})
+
+
+@dataclass(slots=True)
+class JourneyComplexity:
+    """Per-journey complexity facts consumed by the scoring engine.
+
+    Slotted to keep the per-journey footprint small on accounts with
+    thousands of journeys; serialized to plain dicts for report metadata.
+    """
+
+    id: str
+    name: str
+    state: str
+    activity_count: int = 0
+    branching_count: int = 0
+    integration_count: int = 0
+    activity_types: list[str] = field(default_factory=list)
+    has_contact_center: bool = False
+    has_custom_activity: bool = False
 
 
 class JourneysScanner(BaseScanner):
@@ -26,50 +58,71 @@ class JourneysScanner(BaseScanner):
         )
 
         try:
-            journeys = paginate_list(
+            state_counts: Counter[str] = Counter()
+            total_activities = 0
+            journey_complexities: list[JourneyComplexity] = []
+
+            # Stream the journey list and fan out detail + metrics fetches on
+            # the shared I/O pool as each page arrives; the rate limiter still
+            # caps the aggregate request rate.
+            journeys: list[dict] = []
+            detail_futures: dict[str, Future] = {}
+            metrics_futures: dict[str, Future] = {}
+            # Journey IDs whose state makes execution metrics available --
+            # decided once here so the processing loop needs no state check
+            metrics_eligible: set[str] = set()
+            for journey_summary in paginate_list_iter(
                 api_method=self.client.list_journeys,
                 rate_limiter=self.rate_limiter,
                 response_key="JourneysResponse",
                 items_key="Item",
                 ApplicationId=self.app_id,
-            )
-
-            state_counts: dict[str, int] = {}
-            total_activities = 0
-            journey_complexities: list[dict] = []
+            ):
+                journeys.append(journey_summary)
+                journey_id = journey_summary.get("Id", "")
+                if journey_summary.get("State", "UNKNOWN") in EXECUTED_STATES:
+                    metrics_eligible.add(journey_id)
+                if self.io_pool is not None:
+                    detail_futures[journey_id] = self.io_pool.submit(
+                        self.rate_limiter.call_with_retry,
+                        self.client.get_journey,
+                        ApplicationId=self.app_id,
+                        JourneyId=journey_id,
+                    )
+                    if journey_id in metrics_eligible:
+                        metrics_futures[journey_id] = self.io_pool.submit(
+                            self.rate_limiter.call_with_retry,
+                            self.client.get_journey_execution_metrics,
+                            ApplicationId=self.app_id,
+                            JourneyId=journey_id,
+                        )
 
             for journey_summary in journeys:
                 journey_id = journey_summary.get("Id", "")
                 state = journey_summary.get("State", "UNKNOWN")
-                state_counts[state] = state_counts.get(state, 0) + 1
-
-                jc: dict = {
-                    "id": journey_id,
-                    "name": journey_summary.get("Name", ""),
-                    "state": state,
-                    "activity_count": 0,
-                    "branching_count": 0,
-                    "integration_count": 0,
-                    "activity_types": [],
-                    "has_contact_center": False,
-                    "has_custom_activity": False,
-                }
+                state_counts[state] += 1
+
+                activity_count = 0
+                branching_count = 0
+                integration_count = 0
+                activity_types: list[str] = []
+                activity_types_set: set[str] = set()
 
                 try:
-                    detail_resp = self.rate_limiter.call_with_retry(
-                        self.client.get_journey,
-                        ApplicationId=self.app_id,
-                        JourneyId=journey_id,
-                    )
+                    detail_future = detail_futures.get(journey_id)
+                    if detail_future is not None:
+                        detail_resp = detail_future.result()
+                    else:
+                        detail_resp = self.rate_limiter.call_with_retry(
+                            self.client.get_journey,
+                            ApplicationId=self.app_id,
+                            JourneyId=journey_id,
+                        )
                     journey_detail = detail_resp.get("JourneyResponse", {})
                     activities = journey_detail.get("Activities", {})
                     activity_count = len(activities)
                     total_activities += activity_count
 
-                    activity_types_set: set[str] = set()
-                    branching_count = 0
-                    integration_count = 0
-
                     for activity in activities.values():
                         atype = self._classify_activity(activity)
                         activity_types_set.add(atype)
@@ -78,16 +131,13 @@ class JourneysScanner(BaseScanner):
                         if atype in INTEGRATION_ACTIVITIES:
                             integration_count += 1
 
-                    jc["activity_count"] = activity_count
-                    jc["branching_count"] = branching_count
-                    jc["integration_count"] = integration_count
-                    jc["activity_types"] = sorted(activity_types_set)
-                    jc["has_contact_center"] = "ContactCenter" in activity_types_set
-                    jc["has_custom_activity"] = "Custom" in activity_types_set
+                    activity_types = sorted(activity_types_set)
 
+                    # _detail shares the same values (and activity_types list)
+                    # as the complexity record -- stored once, not copied
                     journey_summary["_detail"] = {
                         "activity_count": activity_count,
-                        "activity_types": sorted(activity_types_set),
+                        "activity_types": activity_types,
                         "branching_count": branching_count,
                         "integration_count": integration_count,
                         "start_condition": journey_detail.get("StartCondition"),
@@ -99,14 +149,30 @@ class JourneysScanner(BaseScanner):
                 except Exception as e:
                     journey_summary["_detail"] = {"error": str(e)}
 
+                jc = JourneyComplexity(
+                    id=journey_id,
+                    name=journey_summary.get("Name", ""),
+                    state=state,
+                    activity_count=activity_count,
+                    branching_count=branching_count,
+                    integration_count=integration_count,
+                    activity_types=activity_types,
+                    has_contact_center="ContactCenter" in activity_types_set,
+                    has_custom_activity="Custom" in activity_types_set,
+                )
+
                 # Get execution metrics if journey has been active
-                if state in ("ACTIVE", "COMPLETED", "CLOSED"):
+                if journey_id in metrics_eligible:
                     try:
-                        metrics_resp = self.rate_limiter.call_with_retry(
-                            self.client.get_journey_execution_metrics,
-                            ApplicationId=self.app_id,
-                            JourneyId=journey_id,
-                        )
+                        metrics_future = metrics_futures.get(journey_id)
+                        if metrics_future is not None:
+                            metrics_resp = metrics_future.result()
+                        else:
+                            metrics_resp = self.rate_limiter.call_with_retry(
+                                self.client.get_journey_execution_metrics,
+                                ApplicationId=self.app_id,
+                                JourneyId=journey_id,
+                            )
                         journey_summary["_execution_metrics"] = metrics_resp.get(
                             "JourneyExecutionMetricsResponse", {}
                         )
@@ -119,10 +185,10 @@ class JourneysScanner(BaseScanner):
             result.resource_count = len(journeys)
             result.metadata = {
                 "total": len(journeys),
-                "state_breakdown": state_counts,
+                "state_breakdown": dict(state_counts),
                 "active": state_counts.get("ACTIVE", 0),
                 "total_activities": total_activities,
-                "journey_complexities": journey_complexities,
+                "journey_complexities": [asdict(jc) for jc in journey_complexities],
             }
 
             self._increment_stat("Journeys", len(journeys))
@@ -134,12 +200,12 @@ class JourneysScanner(BaseScanner):
     @staticmethod
     def _classify_activity(activity: dict) -> str:
         """Determine the type of a journey activity."""
-        activity_types = [
-            "ConditionalSplit", "Email", "Holdout", "MultiCondition",
-            "Push", "RandomSplit", "SMS", "Wait", "ContactCenter",
-            "Custom", "Voice",
-        ]
-        for at in activity_types:
-            if at in activity:
-                return at
-        return "Unknown"
+        return _classify_activity_keys(frozenset(activity))
+
+
+@lru_cache(maxsize=256)
+def _classify_activity_keys(keys: frozenset[str]) -> str:
+    """Classify a key set -- activities of the same shape share one lookup."""
+    # Single C-level hash intersection instead of a Python-level scan
+    hit = ACTIVITY_TYPES.intersection(keys)
+    return next(iter(hit), "Unknown")
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import functools
+from collections import defaultdict
+from concurrent.futures import Future
 from datetime import UTC, datetime, timedelta
+from math import fsum
 
 from pinpoint_eda.scanners.base import BaseScanner, ScanResult
 
@@ -20,47 +24,74 @@ APP_KPI_NAMES = [
 ]
 
 
+# Caster per declared KPI value type; unknown types are skipped
+_VALUE_CASTERS = {"Long": int, "Double": float}
+
+# Error codes that mean "no KPI data for this app", not a failure
+_IGNORABLE_ERROR_CODES = frozenset({"NotFoundException"})
+
+
+def _error_code(e: Exception) -> str:
+    """The ClientError code, or empty for non-AWS exceptions."""
+    response = getattr(e, "response", None)
+    if response is None:
+        return ""
+    return response.get("Error", {}).get("Code", "")
+
+
+@functools.lru_cache(maxsize=8)
+def _window_offsets(kpi_days: int) -> tuple[tuple[int, int], ...]:
+    """Day offsets back from "now" for each KPI window, most recent first.
+
+    Pure function of kpi_days, so the window template is computed once per
+    configured value and reused across every app scan in a run."""
+    offsets: list[tuple[int, int]] = []
+    end = 0
+    remaining = min(kpi_days, 90)  # Pinpoint keeps 90 days max
+    while remaining > 0:
+        window = min(remaining, MAX_KPI_WINDOW_DAYS)
+        offsets.append((end + window, end))
+        remaining -= window
+        end += window
+    return tuple(offsets)
+
+
 def _extract_value(row: dict) -> float | None:
-    """Extract numeric value from a KPI row."""
-    # Pinpoint KPI rows have Values list with Type/Value pairs
-    values = row.get("Values", [])
-    for v in values:
-        if v.get("Type") == "Double":
-            return float(v.get("Value", 0))
-        if v.get("Type") == "Long":
-            return int(v.get("Value", 0))
-    # Fallback: check for direct Value field
-    if "Value" in row:
-        try:
-            return float(row["Value"])
-        except (TypeError, ValueError):
-            pass
-    return None
+    """Extract the first numeric value from a KPI row.
+
+    Rows carry either a Values list of Type/Value pairs or a bare Value
+    field; one table lookup picks the cast and a single try/except covers
+    every malformed shape instead of branching per case."""
+    try:
+        for v in row.get("Values", ()):
+            caster = _VALUE_CASTERS.get(v.get("Type"))
+            if caster is not None:
+                return caster(v["Value"])
+        return float(row["Value"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _kpi_values(kpi_data: dict) -> list[float]:
+    """Collect all numeric row values from a KPI entry in one pass."""
+    return [
+        val
+        for row in kpi_data.get("rows", [])
+        if (val := _extract_value(row)) is not None
+    ]
 
 
 def _sum_kpi_rows(kpi_data: dict) -> int:
     """Sum all values from KPI rows."""
-    total = 0
-    for row in kpi_data.get("rows", []):
-        val = _extract_value(row)
-        if val is not None:
-            total += int(val)
-    return total
+    return int(sum(_kpi_values(kpi_data)))
 
 
 def _avg_kpi_rows(kpi_data: dict) -> float | None:
     """Average all values from KPI rows (for rates)."""
-    rows = kpi_data.get("rows", [])
-    if not rows:
-        return None
-    values = []
-    for row in rows:
-        val = _extract_value(row)
-        if val is not None:
-            values.append(val)
+    values = _kpi_values(kpi_data)
     if not values:
         return None
-    return round(sum(values) / len(values), 2)
+    return round(fsum(values) / len(values), 2)
 
 
 class KPIsScanner(BaseScanner):
@@ -78,87 +109,121 @@ class KPIsScanner(BaseScanner):
         )
 
         kpi_data: dict = {"application": {}}
-
-        # Query KPIs in 31-day windows to cover the full kpi_days range
-        end_time = datetime.now(UTC)
-        remaining_days = min(self.kpi_days, 90)  # Pinpoint keeps 90 days max
-
-        while remaining_days > 0:
-            window = min(remaining_days, MAX_KPI_WINDOW_DAYS)
-            window_end = end_time
-            window_start = window_end - timedelta(days=window)
-
-            for kpi_name in APP_KPI_NAMES:
+        # Accumulate rows per KPI with extend -- avoids re-concatenating the
+        # full row list on every window
+        kpi_rows: defaultdict[str, list] = defaultdict(list)
+
+        # Materialize the cached window template from a single "now" so every
+        # KPI in this scan queries identical boundaries
+        now = datetime.now(UTC)
+        windows = [
+            (now - timedelta(days=start_off), now - timedelta(days=end_off))
+            for start_off, end_off in _window_offsets(self.kpi_days)
+        ]
+
+        # KPIs that came back empty in two consecutive windows are dead for
+        # this app -- skip them in later windows (most apps are cold)
+        prior_empty: set[str] = set()
+        dead_kpis: set[str] = set()
+
+        def _submit_window(
+            window_start: datetime, window_end: datetime, kpi_names: list[str]
+        ) -> dict[str, Future]:
+            """Submit one window's KPI calls on the shared pool."""
+            if self.io_pool is None:
+                return {}
+            return {
+                kpi_name: self.io_pool.submit(
+                    self.rate_limiter.call_with_retry,
+                    self.client.get_application_date_range_kpi,
+                    ApplicationId=self.app_id,
+                    KpiName=kpi_name,
+                    StartTime=window_start,
+                    EndTime=window_end,
+                )
+                for kpi_name in kpi_names
+            }
+
+        # Prefetch the first two windows together: both must be queried before
+        # any KPI can be declared dead, so their calls are fully independent.
+        prefetched = [
+            _submit_window(start, end, APP_KPI_NAMES) for start, end in windows[:2]
+        ]
+
+        for idx, (window_start, window_end) in enumerate(windows):
+            active_kpis = [n for n in APP_KPI_NAMES if n not in dead_kpis]
+
+            if idx < len(prefetched):
+                futures = prefetched[idx]
+            else:
+                futures = _submit_window(window_start, window_end, active_kpis)
+
+            for kpi_name in active_kpis:
                 try:
-                    resp = self.rate_limiter.call_with_retry(
-                        self.client.get_application_date_range_kpi,
-                        ApplicationId=self.app_id,
-                        KpiName=kpi_name,
-                        StartTime=window_start,
-                        EndTime=window_end,
-                    )
+                    future = futures.get(kpi_name)
+                    if future is not None:
+                        resp = future.result()
+                    else:
+                        resp = self.rate_limiter.call_with_retry(
+                            self.client.get_application_date_range_kpi,
+                            ApplicationId=self.app_id,
+                            KpiName=kpi_name,
+                            StartTime=window_start,
+                            EndTime=window_end,
+                        )
                     kpi_result = resp.get(
                         "ApplicationDateRangeKpiResponse", {}
                     )
                     rows = kpi_result.get("KpiResult", {}).get("Rows", [])
-                    existing = kpi_data["application"].get(kpi_name, {})
-                    existing_rows = existing.get("rows", [])
-                    kpi_data["application"][kpi_name] = {
-                        "rows": existing_rows + rows,
-                    }
+                    kpi_rows[kpi_name].extend(rows)
+                    if rows:
+                        prior_empty.discard(kpi_name)
+                    elif kpi_name in prior_empty:
+                        dead_kpis.add(kpi_name)
+                    else:
+                        prior_empty.add(kpi_name)
                 except Exception as e:
-                    error_code = ""
-                    if hasattr(e, "response"):
-                        error_code = e.response.get("Error", {}).get("Code", "")
-                    if error_code != "NotFoundException":
+                    if _error_code(e) not in _IGNORABLE_ERROR_CODES:
                         result.errors.append(f"app_kpi_{kpi_name}: {e}")
 
-            remaining_days -= window
-            end_time = window_start
+        kpi_data["application"] = {
+            name: {"rows": rows} for name, rows in kpi_rows.items()
+        }
 
         result.resources = [kpi_data]
         result.resource_count = sum(
             len(v) for v in kpi_data.values() if isinstance(v, dict)
         )
 
-        # Determine if app has recent activity and sum up metrics
-        has_deliveries = False
-        delivery_data = kpi_data["application"].get(
-            "unique-deliveries-grouped-by-date", {}
-        )
-        if delivery_data.get("rows"):
-            has_deliveries = True
-
-        has_sms = bool(
-            kpi_data["application"]
-            .get("txn-sms-sent-grouped-by-date", {})
-            .get("rows")
-        )
-        has_email = bool(
-            kpi_data["application"]
-            .get("txn-emails-sent-grouped-by-date", {})
-            .get("rows")
+        # Determine if app has recent activity and sum up metrics; one local
+        # binding instead of re-walking kpi_data per metric
+        app_kpis = kpi_data["application"]
+        _empty: dict = {}
+        has_deliveries = bool(
+            app_kpis.get("unique-deliveries-grouped-by-date", _empty).get("rows")
         )
+        has_sms = bool(app_kpis.get("txn-sms-sent-grouped-by-date", _empty).get("rows"))
+        has_email = bool(app_kpis.get("txn-emails-sent-grouped-by-date", _empty).get("rows"))
 
         # Aggregate KPI values
         metrics = {
             "unique_deliveries": _sum_kpi_rows(
-                kpi_data["application"].get("unique-deliveries-grouped-by-date", {})
+                app_kpis.get("unique-deliveries-grouped-by-date", _empty)
             ),
             "successful_delivery_rate": _avg_kpi_rows(
-                kpi_data["application"].get("successful-delivery-rate-grouped-by-date", {})
+                app_kpis.get("successful-delivery-rate-grouped-by-date", _empty)
             ),
             "sms_delivered": _sum_kpi_rows(
-                kpi_data["application"].get("txn-sms-delivered-grouped-by-date", {})
+                app_kpis.get("txn-sms-delivered-grouped-by-date", _empty)
             ),
             "sms_sent": _sum_kpi_rows(
-                kpi_data["application"].get("txn-sms-sent-grouped-by-date", {})
+                app_kpis.get("txn-sms-sent-grouped-by-date", _empty)
             ),
             "emails_delivered": _sum_kpi_rows(
-                kpi_data["application"].get("txn-emails-delivered-grouped-by-date", {})
+                app_kpis.get("txn-emails-delivered-grouped-by-date", _empty)
             ),
             "emails_sent": _sum_kpi_rows(
-                kpi_data["application"].get("txn-emails-sent-grouped-by-date", {})
+                app_kpis.get("txn-emails-sent-grouped-by-date", _empty)
             ),
         }
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from pinpoint_eda.pagination import paginate_pinpoint
+from concurrent.futures import Future
+
+from pinpoint_eda.pagination import paginate_pinpoint, paginate_pinpoint_iter
 from pinpoint_eda.scanners.base import BaseScanner, ScanResult
 
 
@@ -21,13 +23,29 @@ class SegmentsScanner(BaseScanner):
         )
 
         try:
-            segments = paginate_pinpoint(
+            # Stream the segment list and fan out version lookups on the
+            # shared I/O pool as each page arrives
+            segments: list[dict] = []
+            version_futures: dict[str, Future] = {}
+            for seg in paginate_pinpoint_iter(
                 api_method=self.client.get_segments,
                 rate_limiter=self.rate_limiter,
                 response_key="SegmentsResponse",
                 items_key="Item",
                 ApplicationId=self.app_id,
-            )
+            ):
+                segments.append(seg)
+                if self.io_pool is not None:
+                    seg_id = seg.get("Id", "")
+                    version_futures[seg_id] = self.io_pool.submit(
+                        paginate_pinpoint,
+                        api_method=self.client.get_segment_versions,
+                        rate_limiter=self.rate_limiter,
+                        response_key="SegmentsResponse",
+                        items_key="Item",
+                        ApplicationId=self.app_id,
+                        SegmentId=seg_id,
+                    )
 
             # Classify segments
             dynamic_count = 0
@@ -41,14 +59,18 @@ class SegmentsScanner(BaseScanner):
 
                 # Get version count for each segment
                 try:
-                    versions = paginate_pinpoint(
-                        api_method=self.client.get_segment_versions,
-                        rate_limiter=self.rate_limiter,
-                        response_key="SegmentsResponse",
-                        items_key="Item",
-                        ApplicationId=self.app_id,
-                        SegmentId=seg["Id"],
-                    )
+                    future = version_futures.get(seg.get("Id", ""))
+                    if future is not None:
+                        versions = future.result()
+                    else:
+                        versions = paginate_pinpoint(
+                            api_method=self.client.get_segment_versions,
+                            rate_limiter=self.rate_limiter,
+                            response_key="SegmentsResponse",
+                            items_key="Item",
+                            ApplicationId=self.app_id,
+                            SegmentId=seg["Id"],
+                        )
                     seg["_version_count"] = len(versions)
                 except Exception:
                     seg["_version_count"] = 0
@@ -4,10 +4,21 @@ from __future__ import annotations
 
 import logging
 
+from pinpoint_eda.pagination import paginate_v2
 from pinpoint_eda.scanners.base import BaseScanner, ScanResult
 
 logger = logging.getLogger(__name__)
 
+# Independent top-level describes: (resource key, method name, response key)
+DESCRIBE_SPECS = [
+    ("phone_numbers", "describe_phone_numbers", "PhoneNumbers"),
+    ("pools", "describe_pools", "Pools"),
+    ("sender_ids", "describe_sender_ids", "SenderIds"),
+    ("opt_out_lists", "describe_opt_out_lists", "OptOutLists"),
+    ("registrations", "describe_registrations", "Registrations"),
+    ("configuration_sets", "describe_configuration_sets", "ConfigurationSets"),
+]
+
 
 class SMSVoiceV2Scanner(BaseScanner):
     name = "sms_voice_v2"
@@ -25,33 +36,36 @@ class SMSVoiceV2Scanner(BaseScanner):
 
         resources: dict = {}
 
-        # Phone numbers
-        resources["phone_numbers"] = self._safe_describe("describe_phone_numbers", "PhoneNumbers")
-        # Pools
-        resources["pools"] = self._safe_describe("describe_pools", "Pools")
-        # Sender IDs
-        resources["sender_ids"] = self._safe_describe("describe_sender_ids", "SenderIds")
-        # Opt-out lists
-        resources["opt_out_lists"] = self._safe_describe("describe_opt_out_lists", "OptOutLists")
-        # Registrations
-        resources["registrations"] = self._safe_describe("describe_registrations", "Registrations")
-        # Configuration sets
-        resources["configuration_sets"] = self._safe_describe(
-            "describe_configuration_sets", "ConfigurationSets"
-        )
-        # Keywords (per phone number)
+        # The six top-level describes are independent -- run them concurrently
+        # when the shared pool is available.
+        if self.io_pool is not None:
+            describe_futures = {
+                name: self.io_pool.submit(self._safe_describe, method_name, result_key)
+                for name, method_name, result_key in DESCRIBE_SPECS
+            }
+            for name, future in describe_futures.items():
+                resources[name] = future.result()
+        else:
+            for name, method_name, result_key in DESCRIBE_SPECS:
+                resources[name] = self._safe_describe(method_name, result_key)
+
+        # Keywords (per phone number) -- fanned out once phone numbers are known
         resources["keywords"] = []
-        for phone in resources.get("phone_numbers", []):
-            phone_id = phone.get("PhoneNumberId", "")
-            if phone_id:
-                kw = self._safe_describe(
-                    "describe_keywords",
-                    "Keywords",
-                    OriginationIdentity=phone_id,
-                )
-                for k in kw:
-                    k["_phone_number_id"] = phone_id
-                resources["keywords"].extend(kw)
+        phone_ids = [
+            p.get("PhoneNumberId", "")
+            for p in resources.get("phone_numbers", [])
+            if p.get("PhoneNumberId", "")
+        ]
+        if self.io_pool is not None and phone_ids:
+            keyword_futures = [
+                self.io_pool.submit(self._describe_keywords, phone_id)
+                for phone_id in phone_ids
+            ]
+            for future in keyword_futures:
+                resources["keywords"].extend(future.result())
+        else:
+            for phone_id in phone_ids:
+                resources["keywords"].extend(self._describe_keywords(phone_id))
 
         total = sum(len(v) for v in resources.values() if isinstance(v, list))
         result.resources = [resources]
@@ -68,23 +82,30 @@ class SMSVoiceV2Scanner(BaseScanner):
         self._increment_stat("SMS/Voice V2", total)
         return result
 
+    def _describe_keywords(self, phone_id: str) -> list:
+        """Fetch keywords for one phone number, tagging each with its origin."""
+        keywords = self._safe_describe(
+            "describe_keywords",
+            "Keywords",
+            OriginationIdentity=phone_id,
+        )
+        for k in keywords:
+            k["_phone_number_id"] = phone_id
+        return keywords
+
     def _safe_describe(self, method_name: str, result_key: str, **kwargs) -> list:
         """Call a describe method, returning empty list on error."""
         try:
-            method = getattr(self.client, method_name)
-            all_items = []
-            token = None
-            while True:
-                call_kwargs = {**kwargs, "MaxResults": 100}
-                if token:
-                    call_kwargs["NextToken"] = token
-                resp = self.rate_limiter.call_with_retry(method, **call_kwargs)
-                items = resp.get(result_key, [])
-                all_items.extend(items)
-                token = resp.get("NextToken")
-                if not token or not items:
-                    break
-            return all_items
+            # paginate_v2 uses the SDK paginator where the client supports it
+            # (server-driven page handling) and falls back to a manual
+            # NextToken loop otherwise.
+            return paginate_v2(
+                client=self.client,
+                method_name=method_name,
+                rate_limiter=self.rate_limiter,
+                result_key=result_key,
+                **kwargs,
+            )
         except Exception as e:
             error_code = ""
             if hasattr(e, "response"):
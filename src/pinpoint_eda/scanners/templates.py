@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from pinpoint_eda.pagination import paginate_list
+from collections import Counter
+from concurrent.futures import Future
+
+from pinpoint_eda.pagination import paginate_list_iter
 from pinpoint_eda.scanners.base import BaseScanner, ScanResult
 
 # Template types and their get methods + response keys
@@ -30,31 +33,52 @@ class TemplatesScanner(BaseScanner):
         )
 
         try:
-            templates = paginate_list(
+            type_counts: Counter[str] = Counter()
+            enriched_templates = []
+
+            # Stream the template list and fan out detail fetches on the
+            # shared I/O pool as each page arrives; each get_*_template call
+            # is an independent round trip.
+            templates: list[dict] = []
+            detail_futures: dict[tuple[str, str], Future] = {}
+            for tmpl in paginate_list_iter(
                 api_method=self.client.list_templates,
                 rate_limiter=self.rate_limiter,
                 response_key="TemplatesResponse",
                 items_key="Item",
-            )
-
-            type_counts: dict[str, int] = {}
-            enriched_templates = []
+            ):
+                templates.append(tmpl)
+                if self.io_pool is not None:
+                    tmpl_name = tmpl.get("TemplateName", "")
+                    tmpl_type = tmpl.get("TemplateType", "UNKNOWN")
+                    if tmpl_type in TEMPLATE_TYPES:
+                        method_name, _ = TEMPLATE_TYPES[tmpl_type]
+                        detail_futures[(tmpl_name, tmpl_type)] = self.io_pool.submit(
+                            self.rate_limiter.call_with_retry,
+                            getattr(self.client, method_name),
+                            TemplateName=tmpl_name,
+                            Version="$LATEST",
+                        )
 
             for tmpl in templates:
                 tmpl_name = tmpl.get("TemplateName", "")
                 tmpl_type = tmpl.get("TemplateType", "UNKNOWN")
-                type_counts[tmpl_type] = type_counts.get(tmpl_type, 0) + 1
+                type_counts[tmpl_type] += 1
 
                 # Get template detail
                 if tmpl_type in TEMPLATE_TYPES:
                     method_name, response_key = TEMPLATE_TYPES[tmpl_type]
                     try:
-                        method = getattr(self.client, method_name)
-                        resp = self.rate_limiter.call_with_retry(
-                            method,
-                            TemplateName=tmpl_name,
-                            Version="$LATEST",
-                        )
+                        future = detail_futures.get((tmpl_name, tmpl_type))
+                        if future is not None:
+                            resp = future.result()
+                        else:
+                            method = getattr(self.client, method_name)
+                            resp = self.rate_limiter.call_with_retry(
+                                method,
+                                TemplateName=tmpl_name,
+                                Version="$LATEST",
+                            )
                         detail = resp.get(response_key, {})
                         tmpl["_detail"] = {
                             "version": detail.get("Version", ""),
@@ -70,7 +94,7 @@ class TemplatesScanner(BaseScanner):
             result.resource_count = len(enriched_templates)
             result.metadata = {
                 "total": len(enriched_templates),
-                "type_breakdown": type_counts,
+                "type_breakdown": dict(type_counts),
                 "has_inapp": type_counts.get("INAPP", 0) > 0,
             }
 
@@ -2,7 +2,41 @@
 
 from __future__ import annotations
 
+import io
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from rich.console import Console
+
+from pinpoint_eda.rate_limiter import RateLimiter
+
+
+@pytest.fixture(scope="session")
+def quiet_console() -> Console:
+    """A console that swallows output, shared across the whole session.
+
+    Replaces per-test Console(file=open("/dev/null", "w")), which leaked a
+    file descriptor per test and re-ran console setup every time."""
+    return Console(file=io.StringIO(), quiet=True)
+
+
+@pytest.fixture(scope="session")
+def thread_pool():
+    """A session-wide pool for tests that exercise real concurrency.
+
+    Thread startup is paid once instead of per test that spins up its
+    own threading.Thread batch."""
+    with ThreadPoolExecutor(max_workers=8, thread_name_prefix="test") as pool:
+        yield pool
+
+
+@pytest.fixture
+def fast_limiter() -> RateLimiter:
+    """A rate limiter fast enough to never sleep in tests.
+
+    For tests that just need a limiter to pass through; tests asserting
+    limiter state (total_calls, throughput) construct their own."""
+    return RateLimiter(requests_per_second=1000.0)
 
 
 @pytest.fixture(autouse=True)
@@ -1,12 +1,23 @@
 """Tests for checkpoint manager."""
 
 
+import json
+
 import pytest
 
 from pinpoint_eda.checkpoint import CheckpointManager
 from pinpoint_eda.exceptions import ConfigMismatchError
 
 
+@pytest.fixture
+def mgr(tmp_path):
+    """An initialized manager; tests that exercise initialize() itself
+    construct their own."""
+    m = CheckpointManager(tmp_path, "hash123")
+    m.initialize()
+    return m
+
+
 class TestCheckpointManager:
     def test_initialize_fresh(self, tmp_path):
         mgr = CheckpointManager(tmp_path, "hash123")
@@ -14,32 +25,24 @@ class TestCheckpointManager:
         assert mgr.run_id
         assert (tmp_path / ".pinpoint-eda-checkpoint.json").exists()
 
-    def test_mark_completed(self, tmp_path):
-        mgr = CheckpointManager(tmp_path, "hash123")
-        mgr.initialize()
-
+    def test_mark_completed(self, mgr):
         mgr.mark_in_progress("segments:us-east-1:app-123")
         mgr.mark_completed("segments:us-east-1:app-123", 45)
 
         assert mgr.is_completed("segments:us-east-1:app-123")
         assert not mgr.is_completed("campaigns:us-east-1:app-123")
 
-    def test_mark_error(self, tmp_path):
-        mgr = CheckpointManager(tmp_path, "hash123")
-        mgr.initialize()
-
+    def test_mark_error(self, mgr):
         mgr.mark_in_progress("segments:us-east-1:app-123")
         mgr.mark_error("segments:us-east-1:app-123", "access denied")
 
         assert len(mgr.errors) == 1
         assert mgr.errors[0]["error"] == "access denied"
 
-    def test_resume(self, tmp_path):
-        # First run
-        mgr1 = CheckpointManager(tmp_path, "hash123")
-        mgr1.initialize()
-        run_id = mgr1.run_id
-        mgr1.mark_completed("segments:us-east-1:app-123", 45)
+    def test_resume(self, tmp_path, mgr):
+        # First run; marks persist via the journal, no explicit flush needed
+        run_id = mgr.run_id
+        mgr.mark_completed("segments:us-east-1:app-123", 45)
 
         # Resume
         mgr2 = CheckpointManager(tmp_path, "hash123")
@@ -47,27 +50,47 @@ class TestCheckpointManager:
         assert mgr2.run_id == run_id
         assert mgr2.is_completed("segments:us-east-1:app-123")
 
-    def test_resume_config_mismatch(self, tmp_path):
-        mgr1 = CheckpointManager(tmp_path, "hash123")
-        mgr1.initialize()
+    def test_marks_append_to_journal_not_snapshot(self, tmp_path, mgr):
+        mgr.mark_completed("segments:us-east-1:app-1", 5)
+
+        # The mark is one journal record; the snapshot is not rewritten
+        snapshot = json.loads((tmp_path / ".pinpoint-eda-checkpoint.json").read_text())
+        assert "segments:us-east-1:app-1" not in snapshot["completed"]
+
+        journal_lines = (
+            (tmp_path / ".pinpoint-eda-checkpoint.jsonl").read_text().splitlines()
+        )
+        records = [json.loads(line) for line in journal_lines]
+        assert {"op": "complete", "key": "segments:us-east-1:app-1"}.items() <= records[
+            -1
+        ].items()
+
+    def test_journal_compacts_into_snapshot(self, tmp_path, mgr):
+        # Enough large records to outgrow the snapshot and force compaction
+        for i in range(20):
+            mgr.mark_completed(f"segments:us-east-1:app-{i}", i, result={"blob": "x" * 200})
+
+        snapshot = json.loads((tmp_path / ".pinpoint-eda-checkpoint.json").read_text())
+        assert "segments:us-east-1:app-0" in snapshot["completed"]
 
+        # Resume still sees everything: snapshot plus any journal tail
+        mgr2 = CheckpointManager(tmp_path, "hash123")
+        mgr2.initialize(resume=True)
+        for i in range(20):
+            assert mgr2.is_completed(f"segments:us-east-1:app-{i}")
+
+    def test_resume_config_mismatch(self, tmp_path, mgr):
         mgr2 = CheckpointManager(tmp_path, "different_hash")
         with pytest.raises(ConfigMismatchError):
             mgr2.initialize(resume=True)
 
-    def test_discovered_regions(self, tmp_path):
-        mgr = CheckpointManager(tmp_path, "hash123")
-        mgr.initialize()
-
+    def test_discovered_regions(self, mgr):
         regions = {"us-east-1": ["app-1", "app-2"], "eu-west-1": ["app-3"]}
         mgr.set_discovered_regions(regions)
 
         assert mgr.get_discovered_regions() == regions
 
-    def test_scan_results_storage(self, tmp_path):
-        mgr = CheckpointManager(tmp_path, "hash123")
-        mgr.initialize()
-
+    def test_scan_results_storage(self, mgr):
         result = {"scanner_name": "segments", "resource_count": 10}
         mgr.mark_completed("segments:us-east-1:app-1", 10, result=result)
 
@@ -75,18 +98,15 @@ class TestCheckpointManager:
         assert "segments:us-east-1:app-1" in stored
         assert stored["segments:us-east-1:app-1"]["resource_count"] == 10
 
-    def test_cleanup(self, tmp_path):
-        mgr = CheckpointManager(tmp_path, "hash123")
-        mgr.initialize()
+    def test_cleanup(self, tmp_path, mgr):
         assert (tmp_path / ".pinpoint-eda-checkpoint.json").exists()
 
         mgr.cleanup()
         assert not (tmp_path / ".pinpoint-eda-checkpoint.json").exists()
+        assert not (tmp_path / ".pinpoint-eda-checkpoint.jsonl").exists()
 
-    def test_atomic_write(self, tmp_path):
+    def test_atomic_write(self, tmp_path, mgr):
         """Verify no .tmp files are left behind."""
-        mgr = CheckpointManager(tmp_path, "hash123")
-        mgr.initialize()
         mgr.mark_completed("test:key:1", 5)
 
         # No tmp files should remain
@@ -1,7 +1,22 @@
 """Tests for parallel executor."""
 
 
-from pinpoint_eda.executor import ScanExecutor
+import threading
+
+from pinpoint_eda.executor import InstrumentedThreadPoolExecutor, ScanExecutor
+
+
+class TestInstrumentedThreadPoolExecutor:
+    def test_tracks_peak_queue_depth(self):
+        with InstrumentedThreadPoolExecutor(max_workers=1) as pool:
+            gate = threading.Event()
+            futures = [pool.submit(gate.wait, 5) for _ in range(4)]
+            gate.set()
+            for future in futures:
+                future.result()
+
+        # One worker, four submissions: at least some had to queue
+        assert pool.peak_queue_depth >= 1
 
 
 class TestScanExecutor:
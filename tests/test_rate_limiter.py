@@ -1,7 +1,5 @@
 """Tests for rate limiter."""
 
-import threading
-
 import pytest
 from botocore.exceptions import ClientError
 
@@ -21,13 +19,11 @@ class TestRateLimiter:
             limiter.acquire()
         assert limiter.total_calls == 10
 
-    def test_call_with_retry_success(self):
-        limiter = RateLimiter(requests_per_second=100.0)
-        result = limiter.call_with_retry(lambda: 42)
+    def test_call_with_retry_success(self, fast_limiter):
+        result = fast_limiter.call_with_retry(lambda: 42)
         assert result == 42
 
-    def test_call_with_retry_non_throttle_error(self):
-        limiter = RateLimiter(requests_per_second=100.0)
+    def test_call_with_retry_non_throttle_error(self, fast_limiter):
 
         def fail():
             raise ClientError(
@@ -37,10 +33,9 @@ class TestRateLimiter:
             )
 
         with pytest.raises(ClientError):
-            limiter.call_with_retry(fail)
+            fast_limiter.call_with_retry(fail)
 
-    def test_call_with_retry_throttle_then_success(self):
-        limiter = RateLimiter(requests_per_second=100.0)
+    def test_call_with_retry_throttle_then_success(self, fast_limiter):
         call_count = 0
 
         def intermittent():
@@ -54,12 +49,11 @@ class TestRateLimiter:
                 )
             return "success"
 
-        result = limiter.call_with_retry(intermittent)
+        result = fast_limiter.call_with_retry(intermittent)
         assert result == "success"
         assert call_count == 3
 
-    def test_call_with_retry_max_retries_exceeded(self):
-        limiter = RateLimiter(requests_per_second=1000.0)
+    def test_call_with_retry_max_retries_exceeded(self, fast_limiter):
 
         def always_throttle():
             raise ClientError(
@@ -69,7 +63,49 @@ class TestRateLimiter:
             )
 
         with pytest.raises(RateLimitExceededError):
-            limiter.call_with_retry(always_throttle)
+            fast_limiter.call_with_retry(always_throttle)
+
+    def test_rate_halves_on_throttle(self):
+        limiter = RateLimiter(requests_per_second=100.0)
+        calls = 0
+
+        def once_throttled():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ClientError(
+                    {"Error": {"Code": "ThrottlingException", "Message": "slow down"},
+                     "ResponseMetadata": {"HTTPStatusCode": 429}},
+                    "GetSegments",
+                )
+            return "ok"
+
+        assert limiter.call_with_retry(once_throttled) == "ok"
+        assert limiter.current_rate == 50.0
+
+    def test_rate_recovers_after_sustained_success(self):
+        limiter = RateLimiter(requests_per_second=1000.0)
+        calls = 0
+
+        def once_throttled():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ClientError(
+                    {"Error": {"Code": "ThrottlingException", "Message": "slow down"},
+                     "ResponseMetadata": {"HTTPStatusCode": 429}},
+                    "GetSegments",
+                )
+            return "ok"
+
+        limiter.call_with_retry(once_throttled)
+        assert limiter.current_rate == 500.0
+
+        for _ in range(100):
+            limiter.call_with_retry(lambda: "ok")
+
+        # One additive step back, still capped at the configured rate
+        assert 500.0 < limiter.current_rate <= 1000.0
 
     def test_throughput(self):
         limiter = RateLimiter(requests_per_second=1000.0)
@@ -77,22 +113,14 @@ class TestRateLimiter:
             limiter.acquire()
         assert limiter.throughput > 0
 
-    def test_thread_safety(self):
+    def test_thread_safety(self, thread_pool):
         limiter = RateLimiter(requests_per_second=1000.0)
-        errors = []
-
-        def acquire_many():
-            try:
-                for _ in range(50):
-                    limiter.acquire()
-            except Exception as e:
-                errors.append(e)
-
-        threads = [threading.Thread(target=acquire_many) for _ in range(5)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
-        assert not errors
+
+        def acquire_many(_):
+            for _ in range(50):
+                limiter.acquire()
+
+        # map re-raises any worker exception when the results are drained
+        list(thread_pool.map(acquire_many, range(5)))
+
         assert limiter.total_calls == 250
@@ -2,10 +2,19 @@
 
 from unittest.mock import MagicMock
 
+from botocore.exceptions import ClientError
+
 from pinpoint_eda.aws_session import AWSSessionManager
 from pinpoint_eda.config import AccountConfig
 from pinpoint_eda.region_discovery import discover_regions
 
+# Built once; reused as a side_effect across clients
+ACCESS_DENIED_CLIENT_ERROR = ClientError(
+    {"Error": {"Code": "AccessDeniedException", "Message": "denied"},
+     "ResponseMetadata": {"HTTPStatusCode": 403}},
+    "GetApps",
+)
+
 
 class TestDiscoverRegions:
     def test_finds_apps_in_regions(self):
@@ -38,18 +47,12 @@ class TestDiscoverRegions:
             assert len(result[region]) > 0
 
     def test_handles_access_denied(self):
-        from botocore.exceptions import ClientError
-
         account = AccountConfig()
         session_manager = MagicMock(spec=AWSSessionManager)
 
         def make_client(acct, region):
             client = MagicMock()
-            client.get_apps.side_effect = ClientError(
-                {"Error": {"Code": "AccessDeniedException", "Message": "denied"},
-                 "ResponseMetadata": {"HTTPStatusCode": 403}},
-                "GetApps",
-            )
+            client.get_apps.side_effect = ACCESS_DENIED_CLIENT_ERROR
             return client
 
         session_manager.get_pinpoint_client.side_effect = make_client
@@ -2,7 +2,7 @@
 
 import json
 
-from rich.console import Console
+import pytest
 
 from pinpoint_eda.complexity import assess_complexity
 from pinpoint_eda.config import ScanConfig
@@ -10,38 +10,47 @@ from pinpoint_eda.report import generate_report, render_report_from_file
 from pinpoint_eda.scanners.base import ScanResult
 
 
+@pytest.fixture(scope="module")
+def sample_results() -> dict:
+    """Scan results shared by all report tests; never mutated."""
+    return {
+        "default:us-east-1": [
+            ScanResult(
+                scanner_name="applications",
+                region="us-east-1",
+                app_id="app-1",
+                resource_count=1,
+                metadata={"name": "TestApp"},
+            ),
+        ]
+    }
+
+
+@pytest.fixture(scope="module")
+def sample_complexity(sample_results):
+    """Complexity assessed once per module -- both tests feed it the same
+    results, so there is no point re-scoring per test."""
+    return assess_complexity(sample_results)
+
+
 class TestGenerateReport:
-    def test_generates_json_file(self, tmp_path):
+    def test_generates_json_file(self, tmp_path, quiet_console, sample_results, sample_complexity):
         config = ScanConfig(output_dir=tmp_path, json_only=True)
-        results = {
-            "default:us-east-1": [
-                ScanResult(
-                    scanner_name="applications",
-                    region="us-east-1",
-                    app_id="app-1",
-                    resource_count=1,
-                    metadata={"name": "TestApp"},
-                ),
-            ]
-        }
-        complexity = assess_complexity(results)
-        console = Console(file=open("/dev/null", "w"))
 
         generate_report(
-            results=results,
-            complexity=complexity,
+            results=sample_results,
+            complexity=sample_complexity,
             config=config,
             scan_duration=5.0,
             api_calls=42,
             errors=[],
-            console=console,
+            console=quiet_console,
         )
 
         json_path = tmp_path / "pinpoint-eda-report.json"
         assert json_path.exists()
 
-        with open(json_path) as f:
-            data = json.load(f)
+        data = json.loads(json_path.read_bytes())
 
         assert "metadata" in data
         assert "complexity" in data
@@ -49,33 +58,20 @@ class TestGenerateReport:
         assert data["metadata"]["api_calls"] == 42
         assert data["metadata"]["scan_duration_seconds"] == 5.0
 
-    def test_render_from_file(self, tmp_path):
+    def test_render_from_file(self, tmp_path, quiet_console, sample_results, sample_complexity):
         # Generate a report first
         config = ScanConfig(output_dir=tmp_path, json_only=True)
-        results = {
-            "default:us-east-1": [
-                ScanResult(
-                    scanner_name="applications",
-                    region="us-east-1",
-                    app_id="app-1",
-                    resource_count=1,
-                    metadata={"name": "TestApp"},
-                ),
-            ]
-        }
-        complexity = assess_complexity(results)
-        console = Console(file=open("/dev/null", "w"))
 
         generate_report(
-            results=results,
-            complexity=complexity,
+            results=sample_results,
+            complexity=sample_complexity,
             config=config,
             scan_duration=5.0,
             api_calls=42,
             errors=[],
-            console=console,
+            console=quiet_console,
         )
 
         # Re-render from file -- should not raise
         json_path = tmp_path / "pinpoint-eda-report.json"
-        render_report_from_file(json_path, console)
+        render_report_from_file(json_path, quiet_console)
@@ -5,9 +5,24 @@ from __future__ import annotations
 from unittest.mock import MagicMock
 
 import pytest
+from botocore.exceptions import ClientError
 
 from pinpoint_eda.rate_limiter import RateLimiter
 
+# One shared instance: the error is never mutated, so tests can reuse it
+# as a side_effect instead of rebuilding the same payload dicts
+NOT_FOUND_CLIENT_ERROR = ClientError(
+    {"Error": {"Code": "NotFoundException", "Message": "not found"},
+     "ResponseMetadata": {"HTTPStatusCode": 404}},
+    "GetChannel",
+)
+
+
+@pytest.fixture(scope="session")
+def not_found_error() -> ClientError:
+    """The shared NotFoundException ClientError."""
+    return NOT_FOUND_CLIENT_ERROR
+
 
 @pytest.fixture
 def rate_limiter():
@@ -17,5 +32,10 @@ def rate_limiter():
 
 @pytest.fixture
 def mock_pinpoint_client():
-    """A mock Pinpoint client."""
+    """A mock Pinpoint client.
+
+    MagicMock rather than a hand-rolled stub: scanner tests configure a
+    different slice of the client API each (return_value / side_effect
+    per method), and the dynamic attribute cost is noise next to that
+    flexibility."""
     return MagicMock()
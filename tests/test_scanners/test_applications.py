@@ -31,6 +31,49 @@ class TestApplicationsScanner:
         assert result.metadata["tags"] == {"env": "prod"}
         assert not result.errors
 
+    def test_scan_uses_inline_tags(self, mock_pinpoint_client, rate_limiter):
+        mock_pinpoint_client.get_app.return_value = {
+            "ApplicationResponse": {
+                "Id": "app-1",
+                "Name": "TestApp",
+                "Arn": "arn:aws:mobiletargeting:us-east-1:123456789012:apps/app-1",
+                "tags": {"team": "growth"},
+            }
+        }
+
+        scanner = ApplicationsScanner(
+            client=mock_pinpoint_client,
+            rate_limiter=rate_limiter,
+            region="us-east-1",
+            app_id="app-1",
+        )
+        result = scanner.scan()
+
+        assert result.metadata["tags"] == {"team": "growth"}
+        mock_pinpoint_client.list_tags_for_resource.assert_not_called()
+
+    def test_scan_trusts_empty_inline_tags(self, mock_pinpoint_client, rate_limiter):
+        mock_pinpoint_client.get_app.return_value = {
+            "ApplicationResponse": {
+                "Id": "app-1",
+                "Name": "TestApp",
+                "Arn": "arn:aws:mobiletargeting:us-east-1:123456789012:apps/app-1",
+                "tags": {},
+            }
+        }
+
+        scanner = ApplicationsScanner(
+            client=mock_pinpoint_client,
+            rate_limiter=rate_limiter,
+            region="us-east-1",
+            app_id="app-1",
+        )
+        result = scanner.scan()
+
+        # Inline empty tags mean the app is untagged -- no extra round trip
+        assert result.metadata["tags"] == {}
+        mock_pinpoint_client.list_tags_for_resource.assert_not_called()
+
     def test_scan_handles_error(self, mock_pinpoint_client, rate_limiter):
         mock_pinpoint_client.get_app.side_effect = Exception("connection error")
 
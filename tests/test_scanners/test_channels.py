@@ -1,36 +1,42 @@
 """Tests for channels scanner."""
 
 
-from botocore.exceptions import ClientError
+import pytest
 
 from pinpoint_eda.scanners.channels import ChannelsScanner
 
+_CHANNEL_METHODS = (
+    "get_email_channel", "get_sms_channel", "get_voice_channel",
+    "get_apns_channel", "get_apns_sandbox_channel", "get_apns_voip_channel",
+    "get_apns_voip_sandbox_channel", "get_gcm_channel", "get_baidu_channel",
+    "get_adm_channel",
+)
+
+
+@pytest.fixture
+def channels_mock(mock_pinpoint_client, not_found_error):
+    """Pinpoint client with every channel lookup raising NotFound.
+
+    Tests flip individual channels on by clearing that method's
+    side_effect and setting a return_value."""
+    for method_name in _CHANNEL_METHODS:
+        getattr(mock_pinpoint_client, method_name).side_effect = not_found_error
+    return mock_pinpoint_client
+
 
 class TestChannelsScanner:
-    def test_scan_with_active_channels(self, mock_pinpoint_client, rate_limiter):
-        mock_pinpoint_client.get_email_channel.return_value = {
+    def test_scan_with_active_channels(self, channels_mock, rate_limiter):
+        channels_mock.get_email_channel.side_effect = None
+        channels_mock.get_email_channel.return_value = {
             "EmailChannelResponse": {"Enabled": True, "IsArchived": False}
         }
-        mock_pinpoint_client.get_sms_channel.return_value = {
+        channels_mock.get_sms_channel.side_effect = None
+        channels_mock.get_sms_channel.return_value = {
             "SMSChannelResponse": {"Enabled": True, "IsArchived": False}
         }
-        # All other channels not found
-        not_found = ClientError(
-            {"Error": {"Code": "NotFoundException", "Message": "not found"},
-             "ResponseMetadata": {"HTTPStatusCode": 404}},
-            "GetChannel",
-        )
-        mock_pinpoint_client.get_voice_channel.side_effect = not_found
-        mock_pinpoint_client.get_apns_channel.side_effect = not_found
-        mock_pinpoint_client.get_apns_sandbox_channel.side_effect = not_found
-        mock_pinpoint_client.get_apns_voip_channel.side_effect = not_found
-        mock_pinpoint_client.get_apns_voip_sandbox_channel.side_effect = not_found
-        mock_pinpoint_client.get_gcm_channel.side_effect = not_found
-        mock_pinpoint_client.get_baidu_channel.side_effect = not_found
-        mock_pinpoint_client.get_adm_channel.side_effect = not_found
 
         scanner = ChannelsScanner(
-            client=mock_pinpoint_client,
+            client=channels_mock,
             rate_limiter=rate_limiter,
             region="us-east-1",
             app_id="app-1",
@@ -43,22 +49,9 @@ class TestChannelsScanner:
         assert result.metadata["active_count"] == 2
         assert not result.errors
 
-    def test_scan_no_channels(self, mock_pinpoint_client, rate_limiter):
-        not_found = ClientError(
-            {"Error": {"Code": "NotFoundException", "Message": "not found"},
-             "ResponseMetadata": {"HTTPStatusCode": 404}},
-            "GetChannel",
-        )
-        for method_name in [
-            "get_email_channel", "get_sms_channel", "get_voice_channel",
-            "get_apns_channel", "get_apns_sandbox_channel", "get_apns_voip_channel",
-            "get_apns_voip_sandbox_channel", "get_gcm_channel", "get_baidu_channel",
-            "get_adm_channel",
-        ]:
-            getattr(mock_pinpoint_client, method_name).side_effect = not_found
-
+    def test_scan_no_channels(self, channels_mock, rate_limiter):
         scanner = ChannelsScanner(
-            client=mock_pinpoint_client,
+            client=channels_mock,
             rate_limiter=rate_limiter,
             region="us-east-1",
             app_id="app-1",
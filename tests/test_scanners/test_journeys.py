@@ -1,5 +1,6 @@
 """Tests for journeys scanner."""
 
+from concurrent.futures import ThreadPoolExecutor
 
 from pinpoint_eda.scanners.journeys import JourneysScanner
 
@@ -39,6 +40,35 @@ class TestJourneysScanner:
         assert result.metadata["active"] == 1
         assert result.metadata["total_activities"] == 4  # 2 activities * 2 journeys (same mock)
 
+    def test_scan_with_io_pool(self, mock_pinpoint_client, rate_limiter):
+        mock_pinpoint_client.list_journeys.return_value = {
+            "JourneysResponse": {
+                "Item": [{"Id": "j-1", "Name": "Onboarding", "State": "ACTIVE"}]
+            }
+        }
+        mock_pinpoint_client.get_journey.return_value = {
+            "JourneyResponse": {"Id": "j-1", "Activities": {"a1": {"Email": {}}}}
+        }
+        mock_pinpoint_client.get_journey_execution_metrics.return_value = {
+            "JourneyExecutionMetricsResponse": {"Metrics": {"ENDPOINT_ENTERED": "100"}}
+        }
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            scanner = JourneysScanner(
+                client=mock_pinpoint_client,
+                rate_limiter=rate_limiter,
+                region="us-east-1",
+                app_id="app-1",
+                io_pool=pool,
+            )
+            result = scanner.scan()
+
+        assert result.resource_count == 1
+        assert result.metadata["total_activities"] == 1
+        assert result.resources[0]["_execution_metrics"] == {
+            "Metrics": {"ENDPOINT_ENTERED": "100"}
+        }
+
     def test_classify_activity(self):
         assert JourneysScanner._classify_activity({"Email": {}}) == "Email"
         assert JourneysScanner._classify_activity({"Wait": {}}) == "Wait"
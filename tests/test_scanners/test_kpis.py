@@ -4,10 +4,16 @@ from __future__ import annotations
 
 from botocore.exceptions import ClientError
 
-from pinpoint_eda.scanners.kpis import APP_KPI_NAMES, KPIsScanner
+from pinpoint_eda.scanners.kpis import APP_KPI_NAMES, KPIsScanner, _window_offsets
 
 
 class TestKPIsScanner:
+    def test_window_offsets_cap_and_tile(self):
+        # 120 requested days cap to 90, tiled into 31-day windows that
+        # abut with no gaps, most recent first
+        assert _window_offsets(120) == ((31, 0), (62, 31), (90, 62))
+        assert _window_offsets(10) == ((10, 0),)
+
     def test_scan_aggregates_metrics_and_activity_flags(self, mock_pinpoint_client, rate_limiter):
         rows_by_kpi = {
             "unique-deliveries-grouped-by-date": [
@@ -88,15 +94,39 @@ class TestKPIsScanner:
 
         call_count = mock_pinpoint_client.get_application_date_range_kpi.call_count
         assert call_count == len(APP_KPI_NAMES) * 3
-        for call in mock_pinpoint_client.get_application_date_range_kpi.call_args_list:
+        calls = mock_pinpoint_client.get_application_date_range_kpi.call_args_list
+        for call in calls:
             window = call.kwargs["EndTime"] - call.kwargs["StartTime"]
             assert window.days <= 31
             assert window.total_seconds() > 0
+        # All KPIs derive from one "now": exactly one boundary pair per window
+        assert len({(c.kwargs["StartTime"], c.kwargs["EndTime"]) for c in calls}) == 3
         assert result.metadata["metrics"]["unique_deliveries"] == 3
         assert result.metadata["metrics"]["sms_sent"] == 3
         assert result.metadata["metrics"]["emails_sent"] == 3
         assert result.metadata["metrics"]["successful_delivery_rate"] == 1.0
 
+    def test_scan_skips_kpis_empty_for_two_consecutive_windows(
+        self, mock_pinpoint_client, rate_limiter
+    ):
+        mock_pinpoint_client.get_application_date_range_kpi.return_value = {
+            "ApplicationDateRangeKpiResponse": {"KpiResult": {"Rows": []}}
+        }
+
+        scanner = KPIsScanner(
+            client=mock_pinpoint_client,
+            rate_limiter=rate_limiter,
+            region="us-east-1",
+            app_id="app-1",
+            kpi_days=90,
+        )
+        result = scanner.scan()
+
+        # Three windows, but every KPI goes dead after two empty windows
+        call_count = mock_pinpoint_client.get_application_date_range_kpi.call_count
+        assert call_count == len(APP_KPI_NAMES) * 2
+        assert result.metadata["is_active"] is False
+
     def test_scan_ignores_not_found_errors(self, mock_pinpoint_client, rate_limiter):
         mock_pinpoint_client.get_application_date_range_kpi.side_effect = ClientError(
             {